@@ -88,8 +88,8 @@ async def health_check():
     return {
         "status": "healthy",
         "services": {
-            "continuous_import": continuous_import_service.is_running,
-            "backfill_worker": backfill_worker.is_running,
+            "continuous_import": continuous_import_service.is_running(),
+            "backfill_worker": backfill_worker.is_running(),
             "websocket_connections": len(websocket_manager.active_connections)
         }
     }
@@ -4,14 +4,13 @@ import logging
 
 from ..models.database import PaperDB, EmbeddingDB
 from ..models.schemas import Paper, SearchResult
-from ..services.embedding_service import EmbeddingService
+from ..services.embedding_service import embedding_service
 from ..services.graphrag_service import GraphRAGService
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 paper_db = PaperDB()
 embedding_db = EmbeddingDB()
-embedding_service = EmbeddingService()
 graphrag_service = GraphRAGService()
 
 @router.get("/semantic", response_model=List[SearchResult])
@@ -31,11 +30,8 @@ async def semantic_search(
             raise HTTPException(status_code=503, detail="Embedding service unavailable")
         
         # Search for similar papers
-        results = embedding_db.search_similar(
-            query_embedding,
-            limit=limit,
-            threshold=threshold
-        )
+        results = await embedding_service.search_similar_async(query_embedding, top_k=limit)
+        results = [r for r in results if r['similarity'] >= threshold]
         
         # Get full paper details
         papers = []
@@ -69,11 +65,11 @@ async def find_similar_papers(
             return []
         
         # Find similar papers
-        results = embedding_db.search_similar(
+        results = await embedding_service.search_similar_async(
             paper_embedding,
-            limit=limit + 1,  # +1 to exclude the paper itself
-            threshold=0.5
+            top_k=limit + 1  # +1 to exclude the paper itself
         )
+        results = [r for r in results if r['similarity'] >= 0.5]
         
         # Filter out the original paper and get details
         papers = []
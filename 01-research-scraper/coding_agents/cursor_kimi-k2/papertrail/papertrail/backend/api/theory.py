@@ -5,13 +5,12 @@ import logging
 from ..models.database import PaperDB
 from ..models.schemas import TheoryAnalysis, TheoryArgument
 from ..services.llm_service import LLMService
-from ..services.embedding_service import EmbeddingService
+from ..services.embedding_service import embedding_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 paper_db = PaperDB()
 llm_service = LLMService()
-embedding_service = EmbeddingService()
 
 @router.post("/analyze", response_model=TheoryAnalysis)
 async def analyze_theory(
@@ -20,7 +19,7 @@ async def analyze_theory(
 ):
     """Analyze a theory/hypothesis against the paper collection"""
     try:
-        if not llm_service.is_available():
+        if not await llm_service.check_availability():
             raise HTTPException(
                 status_code=503,
                 detail="LLM service unavailable. Theory mode is disabled."
@@ -37,9 +36,8 @@ async def analyze_theory(
         if not theory_embedding:
             raise HTTPException(status_code=503, detail="Embedding service unavailable")
         
-        # Analyze each paper for relevance to the theory
-        pro_arguments = []
-        con_arguments = []
+        # Filter papers by relevance to the theory
+        relevant = []
         
         for paper in papers:
             if not paper.summary or paper.summary.startswith("<"):  # Skip placeholders
@@ -60,14 +58,21 @@ async def analyze_theory(
             if relevance < 0.3:  # Skip low relevance papers
                 continue
             
-            # Analyze paper's stance on the theory
-            analysis = await llm_service.analyze_theory_stance(
-                theory=theory,
-                paper_title=paper.title,
-                paper_abstract=paper.abstract,
-                paper_summary=paper.summary
-            )
-            
+            relevant.append((paper, relevance))
+        
+        # Analyze all relevant papers' stances in bulk, sending the theory once per chunk
+        analyses = await llm_service.analyze_theory_stance_batch(
+            theory=theory,
+            papers=[
+                {"title": paper.title, "abstract": paper.abstract, "summary": paper.summary}
+                for paper, _ in relevant
+            ]
+        )
+        
+        pro_arguments = []
+        con_arguments = []
+        
+        for (paper, relevance), analysis in zip(relevant, analyses):
             if analysis:
                 argument = TheoryArgument(
                     paper=paper,
@@ -103,7 +108,7 @@ async def analyze_theory(
 async def get_theory_mode_status():
     """Get the status of theory mode (LLM availability)"""
     try:
-        is_available = llm_service.is_available()
+        is_available = await llm_service.check_availability()
         return {
             "theory_mode_available": is_available,
             "message": "Theory mode is available" if is_available else "LLM service unavailable"
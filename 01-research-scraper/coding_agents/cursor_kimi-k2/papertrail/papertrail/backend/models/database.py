@@ -4,10 +4,22 @@ from typing import List, Dict, Any, Optional
 from tinydb import TinyDB, Query
 from tinydb.storages import JSONStorage
 from tinydb.middlewares import CachingMiddleware
+from sortedcontainers import SortedList
 import os
 
 logger = logging.getLogger(__name__)
 
+def _published_key(doc: Dict[str, Any]) -> str:
+    """Sortable key for a paper's published date"""
+    published = doc.get('published_date', '')
+    if isinstance(published, datetime):
+        return published.isoformat()
+    return str(published or '')
+
+def _status_key(status: Any) -> str:
+    """Normalize a PaperStatus enum or raw string to its stored value"""
+    return getattr(status, 'value', status)
+
 class PaperTrailDB:
     """TinyDB wrapper for PaperTrail database operations"""
     
@@ -25,6 +37,8 @@ class PaperTrailDB:
                               storage=CachingMiddleware(JSONStorage))
         self.backfill_queue_db = TinyDB(os.path.join(data_dir, "backfill_queue.json"),
                                        storage=CachingMiddleware(JSONStorage))
+        self.embed_cache_db = TinyDB(os.path.join(data_dir, "embed_cache.json"),
+                                    storage=CachingMiddleware(JSONStorage))
         
         # Get tables
         self.papers = self.db.table('papers')
@@ -32,9 +46,77 @@ class PaperTrailDB:
         self.relationships = self.relationships_db.table('relationships')
         self.continuous_tasks = self.tasks_db.table('continuous_tasks')
         self.backfill_queue = self.backfill_queue_db.table('backfill_queue')
+        self.embed_cache = self.embed_cache_db.table('embed_cache')
+        
+        # Hashed arXiv id -> TinyDB doc_id index so paper lookups skip the table scan
+        self._paper_idx: Dict[str, int] = {doc['id']: doc.doc_id for doc in self.papers}
+        
+        # (published_date, id) ordered indexes, overall and per status, for pagination
+        self._published_idx = SortedList()
+        self._status_idx: Dict[str, SortedList] = {}
+        for doc in self.papers:
+            self._index_paper(doc)
         
         logger.info("Database initialized successfully")
     
+    def get_paper(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        """Get a paper document by arXiv ID using the id index"""
+        doc_id = self._paper_idx.get(paper_id)
+        if doc_id is None:
+            return None
+        return self.papers.get(doc_id=doc_id)
+    
+    def insert_paper(self, paper_data: Dict[str, Any]) -> int:
+        """Insert a paper document and register it in the id index"""
+        doc_id = self.papers.insert(paper_data)
+        self._paper_idx[paper_data['id']] = doc_id
+        self._index_paper(paper_data)
+        return doc_id
+    
+    def update_paper(self, paper_id: str, fields: Dict[str, Any]) -> bool:
+        """Update a paper document in place via the id index"""
+        doc_id = self._paper_idx.get(paper_id)
+        if doc_id is None:
+            return False
+        
+        reindex = 'status' in fields or 'published_date' in fields
+        if reindex:
+            self._unindex_paper(self.papers.get(doc_id=doc_id))
+        self.papers.update(fields, doc_ids=[doc_id])
+        if reindex:
+            self._index_paper(self.papers.get(doc_id=doc_id))
+        return True
+    
+    def list_papers(self, skip: int = 0, limit: int = 50,
+                    status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Page through papers by published date descending, optionally by status"""
+        if status is None:
+            idx = self._published_idx
+        else:
+            idx = self._status_idx.get(_status_key(status))
+            if idx is None:
+                return []
+        
+        # Walk the ascending index backwards, touching only the requested page
+        n = len(idx)
+        page = idx.islice(max(n - skip - limit, 0), max(n - skip, 0), reverse=True)
+        return [self.get_paper(paper_id) for _, paper_id in page]
+    
+    def _index_paper(self, doc: Dict[str, Any]):
+        """Add a paper to the ordered pagination indexes"""
+        key = (_published_key(doc), doc['id'])
+        self._published_idx.add(key)
+        status = _status_key(doc.get('status'))
+        self._status_idx.setdefault(status, SortedList()).add(key)
+    
+    def _unindex_paper(self, doc: Dict[str, Any]):
+        """Remove a paper from the ordered pagination indexes"""
+        key = (_published_key(doc), doc['id'])
+        self._published_idx.discard(key)
+        status_idx = self._status_idx.get(_status_key(doc.get('status')))
+        if status_idx is not None:
+            status_idx.discard(key)
+    
     def close(self):
         """Close all database connections"""
         self.db.close()
@@ -42,6 +124,7 @@ class PaperTrailDB:
         self.relationships_db.close()
         self.tasks_db.close()
         self.backfill_queue_db.close()
+        self.embed_cache_db.close()
         logger.info("Database connections closed")
 
 # Global database instance
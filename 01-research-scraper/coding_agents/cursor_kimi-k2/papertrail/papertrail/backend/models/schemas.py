@@ -23,6 +23,7 @@ class Paper(BaseModel):
     published_date: datetime
     pdf_url: str
     pdf_content: Optional[str] = None
+    pdf_content_head: Optional[str] = None  # First 2000 chars of pdf_content for embedding
     status: PaperStatus = PaperStatus.NEW
     
     # AI-generated fields (can be placeholders)
@@ -45,7 +46,8 @@ class Paper(BaseModel):
 class Embedding(BaseModel):
     """Schema for paper embeddings"""
     paper_id: str
-    embedding: List[float]
+    embedding_b64: str  # base64 of the float32 vector bytes
+    dim: int
     model_name: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -41,7 +41,7 @@ class ArxivService:
             arxiv_paper = results[0]
             
             # Check if paper already exists
-            existing = db.papers.get(db.papers.id == arxiv_id)
+            existing = db.get_paper(arxiv_id)
             if existing:
                 logger.info(f"Paper {arxiv_id} already exists, skipping")
                 return None
@@ -59,7 +59,7 @@ class ArxivService:
             )
             
             # Store paper in database
-            db.papers.insert(paper.model_dump())
+            await asyncio.to_thread(db.insert_paper, paper.model_dump())
             logger.info(f"Paper {arxiv_id} stored successfully")
             
             return paper
@@ -86,21 +86,19 @@ class ArxivService:
                 try:
                     text = page.extract_text()
                     if text:
-                        text_content += f"
-
---- Page {page_num + 1} ---
-
-{text}"
+                        text_content += f"\n\n--- Page {page_num + 1} ---\n\n{text}"
                 except Exception as e:
                     logger.warning(f"Failed to extract text from page {page_num + 1}: {e}")
             
             if text_content.strip():
                 # Update paper with content
                 paper.pdf_content = text_content
+                # Keep a small head for embedding so the full text never enters that path
+                paper.pdf_content_head = text_content[:2000]
                 paper.file_size = len(response.content)
                 paper.updated_at = datetime.utcnow()
                 
-                db.papers.update(paper.model_dump(), db.papers.id == paper.id)
+                await asyncio.to_thread(db.update_paper, paper.id, paper.model_dump())
                 logger.info(f"PDF content extracted for paper {paper.id}, size: {len(text_content)} chars")
                 
                 return text_content
@@ -1,6 +1,10 @@
+import asyncio
+import base64
+import hashlib
 import logging
 import os
-from typing import List, Optional, Dict, Any
+import threading
+from typing import List, Optional, Dict, Any, Set, Tuple
 import numpy as np
 from sentence_transformers import SentenceTransformer
 import litellm
@@ -9,12 +13,73 @@ from ..models.schemas import Embedding
 
 logger = logging.getLogger(__name__)
 
+FALLBACK_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _cosine_scores(matrix, query):
+        """Dot every (pre-normalized) row with the query in parallel"""
+        n, d = matrix.shape
+        scores = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            acc = np.float32(0.0)
+            for j in range(d):
+                acc += matrix[i, j] * query[j]
+            scores[i] = acc
+        return scores
+else:
+    def _cosine_scores(matrix, query):
+        """Dot every (pre-normalized) row with the query"""
+        return matrix @ query
+
+def encode_embedding(embedding: List[float]) -> str:
+    """Pack an embedding as base64 of its float32 bytes"""
+    return base64.b64encode(np.asarray(embedding, dtype=np.float32).tobytes()).decode('ascii')
+
+def decode_embedding(row: Dict[str, Any]) -> np.ndarray:
+    """Unpack a stored embedding row into a float32 vector"""
+    if 'embedding_b64' in row:
+        return np.frombuffer(base64.b64decode(row['embedding_b64']), dtype=np.float32)
+    # Rows written before embeddings were packed still hold a JSON float list
+    return np.asarray(row['embedding'], dtype=np.float32)
+
 class EmbeddingService:
     """Service for generating embeddings with litellm and sentence-transformers fallback"""
     
     def __init__(self):
         self.default_model = os.getenv("DEFAULT_EMBEDDING_MODEL", "text-embedding-3-small")
         self.fallback_model = None
+        # Row-major matrix of all stored embeddings, loaded once and rebuilt after writes
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_ids: List[str] = []
+        # Optional HNSW index, updated in place as new embeddings are stored
+        self._index = None
+        # Guards the matrix and index, searches run in worker threads while updates run on the event loop
+        self._search_lock = threading.Lock()
+        self._index_labels: List[str] = []
+        self._label_of: Dict[str, int] = {}
+        # Concurrent litellm embedding requests are coalesced into one API call
+        self.batch_size = 32
+        self.batch_timeout = 0.02  # seconds
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        # (model, sha256 of input text) -> packed embedding, persisted in db.embed_cache
+        self._cache: Dict[Tuple[str, str], str] = {
+            (row['model'], row['hash']): row['vec'] for row in db.embed_cache
+        }
         self._setup_fallback()
     
     def _setup_fallback(self):
@@ -39,31 +104,44 @@ class EmbeddingService:
             logger.warning(f"Text too short for paper {paper_id}: {len(text)} chars")
             return None
         
-        # Try litellm first
-        embedding = await self._try_litellm_embedding(text)
+        # Reuse a cached embedding when the exact input text was embedded before
+        text_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        embedding = self._cache_lookup(text_hash)
+        model_name = self.default_model
         
-        if embedding is None and self.fallback_model is not None:
-            # Fallback to sentence-transformers
-            logger.info(f"Using sentence-transformers fallback for paper {paper_id}")
-            embedding = self._try_sentence_transformers_embedding(text)
-        
-        if embedding is None:
-            logger.error(f"Failed to generate embedding for paper {paper_id}")
-            return None
+        if embedding is not None:
+            logger.info(f"Embedding cache hit for paper {paper_id}")
+        else:
+            # Try litellm first
+            embedding = await self._try_litellm_embedding(text)
+            
+            if embedding is None and self.fallback_model is not None:
+                # Fallback to sentence-transformers
+                logger.info(f"Using sentence-transformers fallback for paper {paper_id}")
+                embedding = await asyncio.to_thread(self._try_sentence_transformers_embedding, text)
+                model_name = FALLBACK_MODEL_NAME
+            
+            if embedding is None:
+                logger.error(f"Failed to generate embedding for paper {paper_id}")
+                return None
+            
+            # Only embeddings from the active model are cached, so a fallback embedding is re-generated later
+            if model_name == self.default_model:
+                await asyncio.to_thread(self._cache_store, model_name, text_hash, embedding)
         
         # Store embedding in database
         try:
             embedding_doc = Embedding(
                 paper_id=paper_id,
-                embedding=embedding,
-                model_name=self.default_model if embedding is not None else "sentence-transformers/all-MiniLM-L6-v2"
+                embedding_b64=encode_embedding(embedding),
+                dim=len(embedding),
+                model_name=model_name
             )
             
-            # Remove old embedding if exists
-            db.embeddings.remove(db.embeddings.paper_id == paper_id)
-            
-            # Store new embedding
-            db.embeddings.insert(embedding_doc.model_dump())
+            # Replace any old embedding off the event loop
+            await asyncio.to_thread(self._store_embedding, paper_id, embedding_doc.model_dump())
+            # Applied in a worker as well, so the event loop never waits on the search lock
+            await asyncio.to_thread(self._apply_stored_embedding, paper_id, np.asarray(embedding, dtype=np.float32))
             logger.info(f"Embedding stored for paper {paper_id}")
             
             return embedding
@@ -72,23 +150,70 @@ class EmbeddingService:
             logger.error(f"Failed to store embedding for paper {paper_id}: {e}")
             return None
     
+    def _cache_lookup(self, text_hash: str) -> Optional[List[float]]:
+        """Find a cached embedding of the active model for the text hash"""
+        # Entries of any other model (e.g. the fallback) are misses, their dimensions would not match
+        packed = self._cache.get((self.default_model, text_hash))
+        if packed is None:
+            return None
+        return np.frombuffer(base64.b64decode(packed), dtype=np.float32).tolist()
+    
+    def _cache_store(self, model_name: str, text_hash: str, embedding: List[float]):
+        """Persist an embedding under its (model, text hash) cache key"""
+        try:
+            packed = encode_embedding(embedding)
+            self._cache[(model_name, text_hash)] = packed
+            db.embed_cache.insert({'model': model_name, 'hash': text_hash, 'vec': packed})
+        except Exception as e:
+            logger.warning(f"Failed to cache embedding: {e}")
+    
+    def _store_embedding(self, paper_id: str, embedding_doc: Dict[str, Any]):
+        """Remove any old embedding for the paper and insert the new one"""
+        db.embeddings.remove(db.embeddings.paper_id == paper_id)
+        db.embeddings.insert(embedding_doc)
+    
     async def _try_litellm_embedding(self, text: str) -> Optional[List[float]]:
-        """Try to generate embedding using litellm"""
+        """Try to generate embedding using litellm, batched with concurrent callers"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        
+        if len(self._pending) >= self.batch_size:
+            self._flush_embedding_batch()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_timeout, self._flush_embedding_batch)
+        
+        return await future
+    
+    def _flush_embedding_batch(self):
+        """Send all pending embedding requests as a single litellm call"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run_embedding_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _run_embedding_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        """Embed a batch of texts and resolve each caller's future"""
+        data = []
         try:
             response = await litellm.aembedding(
                 model=self.default_model,
-                input=[text]
+                input=[text for text, _ in batch]
             )
-            
-            if response and response.data and len(response.data) > 0:
-                embedding = response.data[0].embedding
-                logger.debug(f"Generated embedding with litellm, dimensions: {len(embedding)}")
-                return embedding
-            
+            if response and response.data:
+                data = response.data
+                logger.debug(f"Generated {len(data)} embeddings with litellm in one batch")
         except Exception as e:
             logger.warning(f"litellm embedding failed: {e}")
         
-        return None
+        for i, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(data[i].embedding if i < len(data) else None)
     
     def _try_sentence_transformers_embedding(self, text: str) -> Optional[List[float]]:
         """Generate embedding using sentence-transformers fallback"""
@@ -109,39 +234,114 @@ class EmbeddingService:
         try:
             result = db.embeddings.get(db.embeddings.paper_id == paper_id)
             if result:
-                return result['embedding']
+                return decode_embedding(result).tolist()
             return None
         except Exception as e:
             logger.error(f"Failed to retrieve embedding for paper {paper_id}: {e}")
             return None
     
+    def _load_matrix(self):
+        """Batch-load every stored embedding into a single float32 matrix"""
+        rows = db.embeddings.all()
+        self._matrix_ids = [row['paper_id'] for row in rows]
+        if rows:
+            matrix = np.vstack([decode_embedding(row) for row in rows])
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            # C-contiguous float32 keeps the scoring kernel's inner loop SIMD-friendly
+            self._matrix = np.ascontiguousarray(matrix / norms, dtype=np.float32)
+        else:
+            self._matrix = np.empty((0, 0), dtype=np.float32)
+        
+        if HNSWLIB_AVAILABLE and rows:
+            self._build_index()
+    
+    def _build_index(self):
+        """Build the HNSW index from the loaded embedding matrix"""
+        count, dim = self._matrix.shape
+        self._index = hnswlib.Index(space='cosine', dim=dim)
+        self._index.init_index(max_elements=max(2 * count, 1024), ef_construction=200, M=16)
+        self._index.add_items(self._matrix, np.arange(count))
+        self._index_labels = list(self._matrix_ids)
+        self._label_of = {paper_id: label for label, paper_id in enumerate(self._matrix_ids)}
+        logger.info(f"HNSW index built with {count} embeddings")
+    
+    def _apply_stored_embedding(self, paper_id: str, vector: np.ndarray):
+        """Add a newly stored embedding to the index, or drop the matrix so it is reloaded on the next search"""
+        with self._search_lock:
+            if self._index is not None:
+                self._index_add(paper_id, vector)
+            else:
+                self._matrix = None
+    
+    def _index_add(self, paper_id: str, vector: np.ndarray):
+        """Insert or replace a single embedding in the HNSW index (caller holds the search lock)"""
+        try:
+            old_label = self._label_of.get(paper_id)
+            if old_label is not None:
+                self._index.mark_deleted(old_label)
+            
+            label = len(self._index_labels)
+            if label >= self._index.get_max_elements():
+                self._index.resize_index(2 * self._index.get_max_elements())
+            
+            self._index.add_items(vector[np.newaxis, :], [label])
+            self._index_labels.append(paper_id)
+            self._label_of[paper_id] = label
+        except Exception as e:
+            # Fall back to a full reload on the next search
+            logger.warning(f"Failed to update HNSW index, rebuilding on next search: {e}")
+            self._index = None
+            self._matrix = None
+    
     def search_similar(self, query_embedding: List[float], top_k: int = 10) -> List[Dict[str, Any]]:
         """Find most similar papers using cosine similarity"""
+        with self._search_lock:
+            return self._search_similar(query_embedding, top_k)
+    
+    def _search_similar(self, query_embedding: List[float], top_k: int) -> List[Dict[str, Any]]:
+        """Search the matrix or index (caller holds the search lock)"""
         try:
-            query_embedding = np.array(query_embedding)
-            results = []
-            
-            # Get all embeddings
-            all_embeddings = db.embeddings.all()
-            
-            for emb in all_embeddings:
-                paper_embedding = np.array(emb['embedding'])
-                similarity = np.dot(query_embedding, paper_embedding) / (
-                    np.linalg.norm(query_embedding) * np.linalg.norm(paper_embedding)
-                )
-                
-                results.append({
-                    'paper_id': emb['paper_id'],
-                    'similarity': float(similarity)
-                })
-            
-            # Sort by similarity and return top k
-            results.sort(key=lambda x: x['similarity'], reverse=True)
-            return results[:top_k]
+            if self._matrix is None and self._index is None:
+                self._load_matrix()
+            
+            query = np.asarray(query_embedding, dtype=np.float32)
+            query_norm = np.linalg.norm(query)
+            if query_norm == 0:
+                return []
+            
+            if self._index is not None:
+                k = min(top_k, len(self._label_of))
+                if k == 0:
+                    return []
+                labels, distances = self._index.knn_query(query, k=k)
+                return [
+                    {'paper_id': self._index_labels[label], 'similarity': float(1.0 - distance)}
+                    for label, distance in zip(labels[0], distances[0])
+                ]
+            
+            if not self._matrix_ids:
+                return []
+            
+            similarities = _cosine_scores(self._matrix, query / query_norm)
+            
+            # Partial sort to pick the top k, then order just those
+            k = min(top_k, len(similarities))
+            top = np.argpartition(-similarities, k - 1)[:k]
+            top = top[np.argsort(-similarities[top])]
+            
+            return [
+                {'paper_id': self._matrix_ids[i], 'similarity': float(similarities[i])}
+                for i in top
+            ]
             
         except Exception as e:
             logger.error(f"Failed to search similar papers: {e}")
             return []
+    
+    async def search_similar_async(self, query_embedding: List[float], top_k: int = 10) -> List[Dict[str, Any]]:
+        """Run search_similar in a worker thread so async handlers stay responsive"""
+        return await asyncio.to_thread(self.search_similar, query_embedding, top_k)
 
 # Global embedding service instance
 embedding_service = EmbeddingService()
@@ -1,18 +1,63 @@
 import logging
+from collections import Counter
 import networkx as nx
 from typing import List, Dict, Any, Tuple
 import numpy as np
 from ..models.database import db
-from ..models.schemas import Relationship
+from ..models.schemas import Paper, Relationship
 from .embedding_service import embedding_service
 
 logger = logging.getLogger(__name__)
 
+def _weakly_connected_component_count(G: nx.DiGraph) -> int:
+    """Count weakly connected components with a shared-seen, early-exit BFS"""
+    n = len(G)
+    succ = G._succ
+    pred = G._pred
+    seen = set()
+    count = 0
+    for source in G:
+        if source in seen:
+            continue
+        count += 1
+        seen.add(source)
+        nextlevel = [source]
+        while nextlevel:
+            thislevel = nextlevel
+            nextlevel = []
+            for v in thislevel:
+                for w in succ[v]:
+                    if w not in seen:
+                        seen.add(w)
+                        nextlevel.append(w)
+                for w in pred[v]:
+                    if w not in seen:
+                        seen.add(w)
+                        nextlevel.append(w)
+        # Every node has been assigned to a component
+        if len(seen) == n:
+            break
+    return count
+
 class GraphRAGService:
     """GraphRAG system for paper relationship analysis"""
     
     def __init__(self):
         self.graph = nx.MultiDiGraph()
+        # Stats maintained incrementally; clustering is recomputed only after mutations
+        self._rel_type_counts: Counter = Counter()
+        self._cached_clustering = 0.0
+        self._cached_components = 0
+        self._stats_dirty = True
+        # CSR adjacency mirror of the graph for read-heavy traversal, keyed by dense node id
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._neighbors = np.empty(0, dtype=np.int64)
+        self._strengths = np.empty(0, dtype=np.float64)
+        self._rel_type_ids = np.empty(0, dtype=np.int64)
+        self._id_to_dense: Dict[str, int] = {}
+        self._dense_to_id: List[str] = []
+        self._rel_type_names: List[str] = []
+        self._csr_dirty = True
         self._build_graph()
     
     def _build_graph(self):
@@ -20,6 +65,9 @@ class GraphRAGService:
         try:
             # Clear existing graph
             self.graph.clear()
+            self._rel_type_counts.clear()
+            self._stats_dirty = True
+            self._csr_dirty = True
             
             # Add papers as nodes
             papers = db.papers.all()
@@ -44,36 +92,48 @@ class GraphRAGService:
                     strength=rel['strength'],
                     metadata=rel.get('metadata', {})
                 )
+                self._rel_type_counts[rel['relationship_type']] += 1
             
-            logger.info(f"Graph built with {len(self.graph.nodes)} nodes and {len(self.graph.edges)} edges")
+            logger.info("Graph built with %d nodes and %d edges", len(self.graph.nodes), len(self.graph.edges))
             
         except Exception as e:
-            logger.error(f"Failed to build graph: {e}")
+            logger.error("Failed to build graph: %s", e)
+    
+    def add_paper(self, paper: Paper):
+        """Add a newly ingested paper as a node without rebuilding the graph"""
+        self.graph.add_node(
+            paper.id,
+            title=paper.title,
+            authors=paper.authors,
+            abstract=paper.abstract,
+            categories=paper.categories,
+            published_date=paper.published_date,
+            keywords=paper.keywords
+        )
+        self._stats_dirty = True
+        self._csr_dirty = True
     
-    def add_paper_relationships(self, paper_id: str):
+    async def add_paper_relationships(self, paper_id: str):
         """Add relationships for a new paper"""
         try:
             if paper_id not in self.graph:
-                logger.warning(f"Paper {paper_id} not found in graph")
+                logger.warning("Paper %s not found in graph", paper_id)
                 return
             
             # Find similar papers
             embedding = embedding_service.get_embedding(paper_id)
             if embedding:
-                similar_papers = embedding_service.search_similar(embedding, top_k=10)
+                similar_papers = await embedding_service.search_similar_async(embedding, top_k=10)
                 for similar in similar_papers:
                     if similar['paper_id'] != paper_id:
                         self._add_relationship(paper_id, similar['paper_id'], 
                                              'semantic_similarity', similar['similarity'])
             
-            # Rebuild graph to include new relationships
-            self._build_graph()
-            
         except Exception as e:
-            logger.error(f"Failed to add relationships for paper {paper_id}: {e}")
+            logger.error("Failed to add relationships for paper %s: %s", paper_id, e)
     
     def _add_relationship(self, source_id: str, target_id: str, rel_type: str, strength: float):
-        """Add a relationship to the database"""
+        """Add a relationship to the database and the in-memory graph"""
         try:
             relationship = Relationship(
                 source_paper_id=source_id,
@@ -83,10 +143,45 @@ class GraphRAGService:
             )
             
             db.relationships.insert(relationship.model_dump())
-            logger.debug(f"Added relationship: {source_id} -> {target_id} [{rel_type}]")
+            self.graph.add_edge(
+                source_id,
+                target_id,
+                relationship_type=rel_type,
+                strength=strength,
+                metadata=relationship.metadata
+            )
+            self._rel_type_counts[rel_type] += 1
+            self._stats_dirty = True
+            self._csr_dirty = True
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Added relationship: %s -> %s [%s]", source_id, target_id, rel_type)
             
         except Exception as e:
-            logger.error(f"Failed to add relationship: {e}")
+            logger.error("Failed to add relationship: %s", e)
+    
+    def _materialize_csr(self):
+        """Rebuild the CSR adjacency arrays from the mutable graph"""
+        self._dense_to_id = list(self.graph.nodes)
+        self._id_to_dense = {node: i for i, node in enumerate(self._dense_to_id)}
+        rel_type_index: Dict[str, int] = {}
+        
+        offsets = np.zeros(len(self._dense_to_id) + 1, dtype=np.int64)
+        neighbors, strengths, rel_type_ids = [], [], []
+        for i, node in enumerate(self._dense_to_id):
+            for neighbor, edges in self.graph.adj[node].items():
+                for edge_data in edges.values():
+                    rel_type = edge_data['relationship_type']
+                    neighbors.append(self._id_to_dense[neighbor])
+                    strengths.append(edge_data['strength'])
+                    rel_type_ids.append(rel_type_index.setdefault(rel_type, len(rel_type_index)))
+            offsets[i + 1] = len(neighbors)
+        
+        self._offsets = offsets
+        self._neighbors = np.asarray(neighbors, dtype=np.int64)
+        self._strengths = np.asarray(strengths, dtype=np.float64)
+        self._rel_type_ids = np.asarray(rel_type_ids, dtype=np.int64)
+        self._rel_type_names = list(rel_type_index)
+        self._csr_dirty = False
     
     def get_related_papers(self, paper_id: str, relationship_types: List[str] = None) -> List[Dict[str, Any]]:
         """Get papers related to a given paper"""
@@ -94,30 +189,41 @@ class GraphRAGService:
             if paper_id not in self.graph:
                 return []
             
+            if self._csr_dirty:
+                self._materialize_csr()
+            
+            # Slice the outgoing edges of this paper out of the CSR arrays
+            i = self._id_to_dense[paper_id]
+            start, end = self._offsets[i], self._offsets[i + 1]
+            neighbors = self._neighbors[start:end]
+            strengths = self._strengths[start:end]
+            rel_type_ids = self._rel_type_ids[start:end]
+            
+            if relationship_types is not None:
+                wanted = [j for j, name in enumerate(self._rel_type_names) if name in relationship_types]
+                mask = np.isin(rel_type_ids, wanted)
+                neighbors, strengths, rel_type_ids = neighbors[mask], strengths[mask], rel_type_ids[mask]
+            
+            # Sort by strength (descending, stable) in a single vectorized pass
+            order = np.argsort(-strengths, kind='stable')
+            
             related = []
+            for j in order:
+                neighbor = self._dense_to_id[neighbors[j]]
+                paper_data = self.graph.nodes[neighbor]
+                related.append({
+                    'paper_id': neighbor,
+                    'title': paper_data.get('title', ''),
+                    'authors': paper_data.get('authors', []),
+                    'relationship_type': self._rel_type_names[rel_type_ids[j]],
+                    'strength': float(strengths[j]),
+                    'published_date': paper_data.get('published_date', '')
+                })
             
-            # Get outgoing relationships
-            if self.graph.has_node(paper_id):
-                for neighbor in self.graph.neighbors(paper_id):
-                    edges = self.graph[paper_id][neighbor]
-                    for key, edge_data in edges.items():
-                        if relationship_types is None or edge_data['relationship_type'] in relationship_types:
-                            paper_data = self.graph.nodes[neighbor]
-                            related.append({
-                                'paper_id': neighbor,
-                                'title': paper_data.get('title', ''),
-                                'authors': paper_data.get('authors', []),
-                                'relationship_type': edge_data['relationship_type'],
-                                'strength': edge_data['strength'],
-                                'published_date': paper_data.get('published_date', '')
-                            })
-            
-            # Sort by strength
-            related.sort(key=lambda x: x['strength'], reverse=True)
             return related
             
         except Exception as e:
-            logger.error(f"Failed to get related papers: {e}")
+            logger.error("Failed to get related papers: %s", e)
             return []
     
     def get_graph_stats(self) -> Dict[str, Any]:
@@ -126,23 +232,25 @@ class GraphRAGService:
             if not self.graph:
                 return {}
             
+            if self._stats_dirty:
+                # Clustering is undefined for multigraphs, so collapse to a simple
+                # undirected graph; the copy now only happens after mutations
+                self._cached_clustering = nx.average_clustering(nx.Graph(self.graph))
+                self._cached_components = _weakly_connected_component_count(self.graph)
+                self._stats_dirty = False
+            
             stats = {
                 'total_papers': len(self.graph.nodes),
                 'total_relationships': len(self.graph.edges),
-                'relationship_types': {},
-                'connected_components': nx.number_weakly_connected_components(self.graph),
-                'average_clustering': nx.average_clustering(self.graph.to_undirected())
+                'relationship_types': dict(self._rel_type_counts),
+                'connected_components': self._cached_components,
+                'average_clustering': self._cached_clustering
             }
             
-            # Count relationship types
-            for _, _, edge_data in self.graph.edges(data=True):
-                rel_type = edge_data.get('relationship_type', 'unknown')
-                stats['relationship_types'][rel_type] = stats['relationship_types'].get(rel_type, 0) + 1
-            
             return stats
             
         except Exception as e:
-            logger.error(f"Failed to get graph stats: {e}")
+            logger.error("Failed to get graph stats: %s", e)
             return {}
 
 # Global GraphRAG service instance
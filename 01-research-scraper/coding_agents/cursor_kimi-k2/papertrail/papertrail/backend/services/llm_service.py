@@ -1,6 +1,8 @@
 import logging
+import json
 import litellm
 import asyncio
+import time
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import os
@@ -12,27 +14,48 @@ class LLMService:
     
     def __init__(self):
         self.default_model = os.getenv("DEFAULT_MODEL", "gpt-4o-mini")
-        self.is_available = True
-        self._check_availability()
+        # Probed lazily on first use and re-checked periodically so outages self-heal
+        self.is_available: Optional[bool] = None
+        self._last_check = 0.0
+        self.availability_ttl = 60.0
+        # Serializes re-probes so concurrent callers seeing a stale result send a single probe
+        self._check_lock = asyncio.Lock()
     
-    def _check_availability(self):
-        """Check if LLM service is available"""
+    def _is_stale(self) -> bool:
+        """Whether the cached availability needs to be re-probed"""
+        return self.is_available is None or time.monotonic() - self._last_check > self.availability_ttl
+    
+    async def check_availability(self) -> bool:
+        """Return LLM availability, re-probing when the cached result is stale"""
+        if self._is_stale():
+            async with self._check_lock:
+                # Another caller may have re-probed while this one waited for the lock
+                if self._is_stale():
+                    await self._async_check()
+        return self.is_available
+    
+    async def _async_check(self):
+        """Check if LLM service is available without blocking the event loop"""
         try:
-            response = litellm.completion(
+            response = await asyncio.to_thread(
+                litellm.completion,
                 model=self.default_model,
                 messages=[{"role": "user", "content": "test"}],
-                max_tokens=1
+                max_tokens=1,
+                timeout=2
             )
             self.is_available = response is not None
             logger.info(f"LLM service availability: {self.is_available}")
         except Exception as e:
             logger.warning(f"LLM service unavailable: {e}")
             self.is_available = False
+        finally:
+            self._last_check = time.monotonic()
     
     async def generate_paper_summary(self, paper_data: Dict[str, Any]) -> Dict[str, str]:
         """Generate comprehensive paper summary using LLM"""
         
-        if not self.is_available:
+        if not await self.check_availability():
             logger.warning("LLM unavailable, returning placeholders")
             return {
                 "summary": "<summary>",
@@ -52,5 +75,59 @@ class LLMService:
             "further_research": "Further research"
         }
 
+    async def analyze_theory_stance_batch(self, theory: str,
+                                          papers: List[Dict[str, Any]],
+                                          chunk_size: int = 8) -> List[Optional[Dict[str, Any]]]:
+        """Analyze the stance of many papers towards a theory with one prompt per chunk"""
+        if not papers:
+            return []
+        
+        if not await self.check_availability():
+            logger.warning("LLM unavailable, skipping theory stance analysis")
+            return [None] * len(papers)
+        
+        chunks = [papers[i:i + chunk_size] for i in range(0, len(papers), chunk_size)]
+        chunk_results = await asyncio.gather(
+            *[self._analyze_theory_stance_chunk(theory, chunk) for chunk in chunks]
+        )
+        return [result for chunk in chunk_results for result in chunk]
+    
+    async def _analyze_theory_stance_chunk(self, theory: str,
+                                           papers: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Run a single bulk stance classification call for a chunk of papers"""
+        paper_blocks = []
+        for i, paper in enumerate(papers, start=1):
+            paper_blocks.append(
+                f"[{i}] Title: {paper.get('title', '')}\n"
+                f"Abstract: {paper.get('abstract', '')}\n"
+                f"Summary: {paper.get('summary', '')}"
+            )
+        
+        prompt = (
+            f"Theory: {theory}\n\n"
+            "For each numbered paper below, decide whether it is supporting, contradicting "
+            "or neutral towards the theory.\n\n"
+            + "\n\n".join(paper_blocks)
+            + "\n\nRespond with only a JSON array with one object per paper, in order, "
+            'shaped like {"stance": "supporting|contradicting|neutral", '
+            '"quotes": ["..."], "summary": "..."}.'
+        )
+        
+        try:
+            response = await litellm.acompletion(
+                model=self.default_model,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            analyses = json.loads(response.choices[0].message.content)
+            if not isinstance(analyses, list):
+                raise ValueError("expected a JSON array")
+        except Exception as e:
+            logger.error(f"Theory stance batch analysis failed: {e}")
+            return [None] * len(papers)
+        
+        # Pad or trim so results always line up with the input papers
+        analyses = analyses[:len(papers)]
+        return analyses + [None] * (len(papers) - len(analyses))
+
 # Global LLM service instance
 llm_service = LLMService()
@@ -6,41 +6,69 @@ from ..models.database import db
 from ..models.schemas import Paper, PaperStatus
 from .arxiv_service import arxiv_service
 from .embedding_service import embedding_service
+from .graphrag_service import graphrag_service
 from .llm_service import llm_service
 
 logger = logging.getLogger(__name__)
 
+# Fields written back after LLM enrichment; everything else is unchanged since insert
+LLM_FIELDS = {
+    "summary", "keywords", "key_contributions", "methodology",
+    "results", "further_research", "updated_at"
+}
+
 class PaperService:
     """Service for paper ingestion and processing"""
     
     def __init__(self):
-        self.processing_queue = set()
+        self._inflight: Dict[str, asyncio.Future] = {}
     
     async def ingest_paper(self, arxiv_id: str) -> Optional[Paper]:
         """Ingest a single paper from arXiv"""
+        # Concurrent callers for the same paper share one in-flight ingestion
+        if arxiv_id in self._inflight:
+            logger.info("Paper %s already being processed, awaiting result", arxiv_id)
+            # Shielded so a cancelled waiter does not cancel the shared future
+            return await asyncio.shield(self._inflight[arxiv_id])
+        
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[arxiv_id] = fut
         try:
-            logger.info(f"Starting ingestion for paper: {arxiv_id}")
-            
-            # Check if already processing
-            if arxiv_id in self.processing_queue:
-                logger.info(f"Paper {arxiv_id} already being processed")
-                return None
-            
-            self.processing_queue.add(arxiv_id)
+            paper = await self._ingest_paper(arxiv_id)
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as e:
+            if not fut.done():
+                fut.set_exception(e)
+                # Mark as retrieved so an unawaited future does not log a warning
+                fut.exception()
+            raise
+        else:
+            if not fut.done():
+                fut.set_result(paper)
+            return paper
+        finally:
+            del self._inflight[arxiv_id]
+    
+    async def _ingest_paper(self, arxiv_id: str) -> Optional[Paper]:
+        """Fetch, embed and enrich a single paper"""
+        try:
+            logger.info("Starting ingestion for paper: %s", arxiv_id)
             
             # Fetch paper metadata
             paper = await arxiv_service.fetch_paper_by_id(arxiv_id)
             if not paper:
-                logger.warning(f"Failed to fetch paper {arxiv_id}")
+                logger.warning("Failed to fetch paper %s", arxiv_id)
                 return None
             
             # Fetch PDF content
             await arxiv_service.fetch_paper_content(paper)
             
             # Generate embedding
-            text_for_embedding = f"{paper.title} {paper.abstract}"
-            if paper.pdf_content:
-                text_for_embedding += f" {paper.pdf_content[:2000]}"
+            text_for_embedding = " ".join(
+                (paper.title, paper.abstract, paper.pdf_content_head or "")
+            )
             
             await embedding_service.generate_embedding(text_for_embedding, paper.id)
             
@@ -57,64 +85,56 @@ class PaperService:
             paper.further_research = summary_data.get("further_research", "<further_research>")
             paper.updated_at = datetime.utcnow()
             
-            # Update in database
-            db.papers.update(paper.model_dump(), db.papers.id == paper.id)
+            # Update only the enriched fields so pdf_content is not re-serialized
+            await asyncio.to_thread(db.update_paper, paper.id, paper.model_dump(include=LLM_FIELDS))
             
-            logger.info(f"Successfully ingested paper: {arxiv_id}")
+            # Register the paper in the knowledge graph incrementally
+            graphrag_service.add_paper(paper)
+            
+            logger.info("Successfully ingested paper: %s", arxiv_id)
             return paper
             
         except Exception as e:
-            logger.error(f"Failed to ingest paper {arxiv_id}: {e}")
+            logger.error("Failed to ingest paper %s: %s", arxiv_id, e)
             return None
-        finally:
-            self.processing_queue.discard(arxiv_id)
     
     def get_paper(self, paper_id: str) -> Optional[Paper]:
         """Get a paper by ID"""
         try:
-            result = db.papers.get(db.papers.id == paper_id)
+            result = db.get_paper(paper_id)
             if result:
                 return Paper(**result)
             return None
         except Exception as e:
-            logger.error(f"Failed to get paper {paper_id}: {e}")
+            logger.error("Failed to get paper %s: %s", paper_id, e)
             return None
     
     def list_papers(self, skip: int = 0, limit: int = 50, 
                    status: Optional[PaperStatus] = None) -> List[Paper]:
         """List papers with pagination and filtering"""
         try:
-            query = db.papers.all()
-            
-            if status:
-                query = [p for p in query if p.get('status') == status]
-            
-            # Sort by published date descending
-            query.sort(key=lambda x: x.get('published_date', ''), reverse=True)
+            # Filtering, ordering and slicing happen on the DB's sorted indexes
+            docs = db.list_papers(skip=skip, limit=limit, status=status)
             
-            papers = [Paper(**p) for p in query[skip:skip + limit]]
+            papers = [Paper(**p) for p in docs]
             return papers
             
         except Exception as e:
-            logger.error(f"Failed to list papers: {e}")
+            logger.error("Failed to list papers: %s", e)
             return []
     
     def update_paper_status(self, paper_id: str, status: PaperStatus) -> bool:
         """Update paper status"""
         try:
-            paper = self.get_paper(paper_id)
-            if not paper:
+            # Partial update; no need to load and re-serialize the whole paper
+            if not db.update_paper(paper_id, {"status": status, "updated_at": datetime.utcnow()}):
                 return False
             
-            paper.status = status
-            paper.updated_at = datetime.utcnow()
-            
-            db.papers.update(paper.model_dump(), db.papers.id == paper_id)
-            logger.info(f"Updated paper {paper_id} status to {status}")
+            logger.info("Updated paper %s status to %s", paper_id, status)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to update paper status: {e}")
+            logger.error("Failed to update paper status: %s", e)
             return False
 
 # Global paper service instance
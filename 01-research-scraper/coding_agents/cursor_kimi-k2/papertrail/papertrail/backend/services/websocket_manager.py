@@ -1,32 +1,39 @@
-import json
+import asyncio
 import logging
-from typing import List
+import orjson
+from typing import Set
 from fastapi import WebSocket
 
 class WebSocketManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.logger = logging.getLogger(__name__)
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
-        self.logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
+        self.active_connections.add(websocket)
+        self.logger.info("WebSocket connected. Total connections: %d", len(self.active_connections))
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        self.logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
+        self.active_connections.discard(websocket)
+        self.logger.info("WebSocket disconnected. Total connections: %d", len(self.active_connections))
 
     async def broadcast(self, message: dict):
         if not self.active_connections:
             return
             
-        message_json = json.dumps(message)
+        # orjson encodes in C; keep text frames so browser clients can JSON.parse them
+        message_json = orjson.dumps(message).decode()
         
-        for connection in self.active_connections[:]:
+        async def _send(connection: WebSocket):
             try:
                 await connection.send_text(message_json)
             except Exception as e:
-                self.logger.error(f"Error broadcasting: {e}")
+                self.logger.error("Error broadcasting: %s", e)
                 self.disconnect(connection)
+        
+        # Fan out concurrently so one slow client does not delay the others
+        await asyncio.gather(
+            *[_send(connection) for connection in tuple(self.active_connections)],
+            return_exceptions=True
+        )
@@ -1,8 +1,10 @@
+import atexit
 import logging
 import os
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 def setup_logging():
     """Setup comprehensive logging configuration"""
@@ -50,10 +52,15 @@ def setup_logging():
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(detailed_formatter)
     
-    # Add handlers to root logger
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(error_handler)
+    # Write records from a background thread; callers only enqueue them
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue, console_handler, file_handler, error_handler,
+        respect_handler_level=True
+    )
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
     
     # Reduce noise from third-party libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -63,3 +70,4 @@ def setup_logging():
     logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
     
     logging.getLogger(__name__).info("Logging configuration complete")
+    return listener
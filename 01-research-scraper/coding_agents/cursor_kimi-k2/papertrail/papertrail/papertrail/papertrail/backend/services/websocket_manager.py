@@ -1,27 +1,35 @@
-import json
+import asyncio
 import logging
-from typing import List
+import orjson
+from typing import Set
 from fastapi import WebSocket
 
 class WebSocketManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.logger = logging.getLogger(__name__)
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
 
     async def broadcast(self, message: dict):
         if not self.active_connections:
             return
-        message_json = json.dumps(message)
-        for connection in self.active_connections[:]:
+        # orjson encodes in C; keep text frames so browser clients can JSON.parse them
+        message_json = orjson.dumps(message).decode()
+
+        async def _send(connection: WebSocket):
             try:
                 await connection.send_text(message_json)
             except Exception:
                 self.disconnect(connection)
+
+        # Fan out concurrently so one slow client does not delay the others
+        await asyncio.gather(
+            *[_send(connection) for connection in tuple(self.active_connections)],
+            return_exceptions=True
+        )
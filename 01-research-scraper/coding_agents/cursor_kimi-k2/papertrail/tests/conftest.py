@@ -0,0 +1,7 @@
+"""Shared test setup for the PaperTrail backend."""
+
+import os
+import tempfile
+
+# The backend opens its TinyDB files under ./data on import, keep them out of the project directory
+os.chdir(tempfile.mkdtemp(prefix="papertrail-tests-"))
@@ -0,0 +1,62 @@
+"""Tests for the embedding cache."""
+
+import asyncio
+import hashlib
+import threading
+
+from papertrail.backend.services.embedding_service import (
+    FALLBACK_MODEL_NAME,
+    EmbeddingService,
+    encode_embedding,
+)
+
+TEXT = "A paper about graph neural networks and their applications."
+TEXT_HASH = hashlib.sha256(TEXT.encode('utf-8')).hexdigest()
+
+
+def _bare_service(cache):
+    """Create a service without loading any model or touching the database"""
+    service = EmbeddingService.__new__(EmbeddingService)
+    service.default_model = "primary-model"
+    service.fallback_model = None
+    service._cache = cache
+    service._index = None
+    service._matrix = None
+    service._search_lock = threading.Lock()
+    service._store_embedding = lambda paper_id, doc: None
+    return service
+
+
+def test_cache_hit_for_active_model():
+    """An entry of the active model is returned."""
+    service = _bare_service({("primary-model", TEXT_HASH): encode_embedding([0.5, 0.25])})
+    assert service._cache_lookup(TEXT_HASH) == [0.5, 0.25]
+
+
+def test_fallback_model_entry_is_a_miss():
+    """An entry of the fallback model is not returned as if it were the active model."""
+    service = _bare_service({(FALLBACK_MODEL_NAME, TEXT_HASH): encode_embedding([0.5, 0.25])})
+    assert service._cache_lookup(TEXT_HASH) is None
+
+
+def test_fallback_embedding_is_regenerated_with_active_model():
+    """A paper embedded with the fallback is re-embedded once the active model is available."""
+    service = _bare_service({})
+    service.fallback_model = object()
+    service._try_sentence_transformers_embedding = lambda text: [1.0, 0.0, 0.0]
+    stored = []
+    service._cache_store = lambda model, text_hash, embedding: stored.append(model)
+
+    async def litellm_down(text):
+        return None
+
+    service._try_litellm_embedding = litellm_down
+    assert asyncio.run(service.generate_embedding(TEXT, "paper-1")) == [1.0, 0.0, 0.0]
+    assert stored == []
+
+    async def litellm_up(text):
+        return [0.1, 0.2]
+
+    service._try_litellm_embedding = litellm_up
+    assert asyncio.run(service.generate_embedding(TEXT, "paper-1")) == [0.1, 0.2]
+    assert stored == ["primary-model"]
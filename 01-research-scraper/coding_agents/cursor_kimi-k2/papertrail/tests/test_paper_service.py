@@ -0,0 +1,82 @@
+"""Tests for concurrent paper ingestion."""
+
+import asyncio
+
+import pytest
+
+from papertrail.backend.services.paper_service import PaperService
+
+
+def _service_with_blocking_ingest():
+    """Create a service whose ingestion waits until the returned event is set"""
+    service = PaperService()
+    release = asyncio.Event()
+
+    async def fake_ingest(arxiv_id):
+        await release.wait()
+        return f"paper-{arxiv_id}"
+
+    service._ingest_paper = fake_ingest
+    return service, release
+
+
+def test_concurrent_callers_share_one_ingestion():
+    """Callers for the same paper receive the result of the single in-flight ingestion."""
+    async def scenario():
+        service, release = _service_with_blocking_ingest()
+        calls = []
+        ingest = service._ingest_paper
+
+        async def counting_ingest(arxiv_id):
+            calls.append(arxiv_id)
+            return await ingest(arxiv_id)
+
+        service._ingest_paper = counting_ingest
+        tasks = [asyncio.create_task(service.ingest_paper("1234")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ["paper-1234"] * 3
+        assert calls == ["1234"]
+        assert service._inflight == {}
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_cancel_ingestion():
+    """Cancelling a waiter leaves the owner and the other waiters unaffected."""
+    async def scenario():
+        service, release = _service_with_blocking_ingest()
+        owner = asyncio.create_task(service.ingest_paper("1234"))
+        await asyncio.sleep(0)
+        cancelled_waiter = asyncio.create_task(service.ingest_paper("1234"))
+        other_waiter = asyncio.create_task(service.ingest_paper("1234"))
+        await asyncio.sleep(0)
+
+        cancelled_waiter.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await owner == "paper-1234"
+        assert await other_waiter == "paper-1234"
+        assert cancelled_waiter.cancelled()
+        assert service._inflight == {}
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_owner_cancels_waiters():
+    """Cancelling the owner cancels the shared ingestion for every waiter."""
+    async def scenario():
+        service, _ = _service_with_blocking_ingest()
+        owner = asyncio.create_task(service.ingest_paper("1234"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(service.ingest_paper("1234"))
+        await asyncio.sleep(0)
+
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert service._inflight == {}
+
+    asyncio.run(scenario())
@@ -53,6 +53,13 @@ def main():
     # Remove the handler that outputs the logs to the console as it may cause visual glitches in the UI
     AppConfiguration.logger.remove_handler_of_console_stream()
 
+    # Use uvloop for lower per-task scheduling overhead where it is available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     app = AmongLLMs(runtime_config)
     app.run()
 
@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 
 from textual import log
@@ -8,19 +9,24 @@ from allms.config import AppConfiguration, RunTimeConfiguration
 from .screens.main import MainScreen
 
 
+_ROOT_CSS_PATH = Path(__file__).parent / "css"
+_CSS_FILES = [
+    # Note: Ordering matters
+    "global.scss",
+    "main.scss",
+    "new.scss",
+    "chat.scss",
+    "contents.scss",
+    "ended.scss"
+]
+# Read once at import so the app parses a single stylesheet instead of opening each file
+_CSS = "\n".join((_ROOT_CSS_PATH / name).read_text(encoding="utf-8") for name in _CSS_FILES)
+
+
 class AmongLLMs(App):
 
     AUTO_FOCUS = None
-    ROOT_CSS_PATH = Path(__file__).parent / "css"
-    CSS_PATH = [
-        # Note: Ordering matters
-        ROOT_CSS_PATH / "global.scss",
-        ROOT_CSS_PATH / "main.scss",
-        ROOT_CSS_PATH / "new.scss",
-        ROOT_CSS_PATH / "chat.scss",
-        ROOT_CSS_PATH / "contents.scss",
-        ROOT_CSS_PATH / "ended.scss"
-    ]
+    CSS = _CSS
 
     BINDINGS = [
         # TODO: Create the bindings
@@ -34,6 +40,7 @@ class AmongLLMs(App):
     def on_ready(self) -> None:
         msg = f"Start time: {AppConfiguration.clock.current_time_in_iso_format()}"
         log.debug(msg)
+        log.debug(f"Event loop: {asyncio.get_running_loop().__class__}")
 
     def get_default_screen(self) -> Screen:
         return self._main_screen
@@ -1,3 +1,5 @@
+import functools
+
 from allms.config import AppConfiguration
 
 
@@ -19,15 +21,19 @@ class Banner:
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def add_border(content: str,
-                   additional_lines: list[str] = None,
+                   additional_lines: tuple[str, ...] = None,
                    border_char: str = "*",
                    hpad: int = 0,
                    vpad: int = 0,
                    pad_top: bool = True,
                    pad_bottom: bool = True
                    ) -> str:
-        """ Helper method to add border to the given content string """
+        """
+        Helper method to add border to the given content string
+        Cached since the banners are constant, so the additional lines must be a (hashable) tuple
+        """
         lines = content.splitlines()
         if additional_lines is not None:
             lines.extend(additional_lines)
@@ -19,5 +19,7 @@ class ChatCallbackType(BaseCallbackType):
 class ChatCallbacks(BaseCallbacks):
     """ Class containing the callbacks of the chat """
 
+    __slots__ = ()
+
     def __init__(self, callback_mappings: dict[ChatCallbackType, Callable[..., Any]] = None):
         super().__init__(callback_mappings)
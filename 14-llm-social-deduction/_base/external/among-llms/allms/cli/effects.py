@@ -35,7 +35,8 @@ class TextualEffects:
     def get_random_effect() -> tuple[EffectType, dict[str, Any]]:
         """ Returns a random effect as (effect_type, effect_config) """
         random_effect: EffectType = random.choice(list(TextualEffects.__effect_config_map.keys()))
-        effect_config = TextualEffects.__effect_config_map[random_effect]
+        # Copy so that the shared, pre-configured map is never mutated
+        effect_config = dict(TextualEffects.__effect_config_map[random_effect])
 
         # Set some parameters statically to ensure a slightly longer animation
         effect_config["final_gradient_frames"] = 10
@@ -47,7 +48,7 @@ class TextualEffects:
     def get_effect_config(effect: EffectType) -> dict[str, Any]:
         """ Returns the configuration for the specified effect """
         TextualEffects.__effect_exists_check(effect)
-        return TextualEffects.__effect_config_map[effect]
+        return dict(TextualEffects.__effect_config_map[effect])
 
     @staticmethod
     def __effect_exists_check(effect: str | EffectType) -> None:
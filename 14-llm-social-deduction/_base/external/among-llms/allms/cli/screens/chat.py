@@ -14,7 +14,12 @@ class ChatroomScreen(Screen):
         self._config = config
         self._state_manager = state_manager
         self._is_disabled = is_disabled
+        self._chatroom_widget = ChatroomWidget(self._config, self._state_manager, is_disabled=self._is_disabled)
 
     def compose(self) -> ComposeResult:
-        yield ChatroomWidget(self._config, self._state_manager, is_disabled=self._is_disabled)
+        yield self._chatroom_widget
         yield Footer()
+
+    def on_screen_resume(self) -> None:
+        # Add the messages that arrived while another screen (e.g. a modal) was on top
+        self._chatroom_widget.flush_deferred_entries()
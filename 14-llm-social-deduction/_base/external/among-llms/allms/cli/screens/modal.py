@@ -1,4 +1,5 @@
-from typing import Type
+from types import MappingProxyType
+from typing import Mapping, Type
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -10,6 +11,10 @@ from allms.cli.widgets.modal import ModalScreenWidget
 from allms.core.state import GameStateManager
 
 
+# Shared read-only default for screens constructed without widget parameters
+_EMPTY: Mapping = MappingProxyType({})
+
+
 class BaseModalScreen(ModalScreen):
     """ Base class for a modal screen """
 
@@ -22,7 +27,7 @@ class BaseModalScreen(ModalScreen):
                  config: RunTimeConfiguration,
                  state_manager: GameStateManager,
                  widget_cls: Type[ModalScreenWidget],
-                 widget_params: dict = None,
+                 widget_params: Mapping = None,
                  *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._title = title
@@ -30,7 +35,7 @@ class BaseModalScreen(ModalScreen):
         self._state_manager = state_manager
 
         if widget_params is None:
-            widget_params = dict()
+            widget_params = _EMPTY
         self._widget = widget_cls(self._title, self._config, self._state_manager, **widget_params)
 
     def compose(self) -> ComposeResult:
@@ -1,3 +1,4 @@
+from textual.app import ComposeResult
 from textualeffects.widgets import SplashScreen
 
 from allms.config import AppConfiguration
@@ -7,10 +8,14 @@ from allms.cli.effects import TextualEffects
 
 class MainSplashScreen(SplashScreen):
     def __init__(self):
+        # Note: The effect and banner are prepared lazily when the screen is composed
+        super().__init__(text="")
+
+    def compose(self) -> ComposeResult:
         effect, config = TextualEffects.get_random_effect()
 
         app_dev = AppConfiguration.app_dev
-        app_lines = [f"--+ by {app_dev} +--"]
+        app_lines = (f"--+ by {app_dev} +--",)
 
         banner_text = Banner.splash_banner
         banner_text = Banner.add_border(
@@ -22,4 +27,8 @@ class MainSplashScreen(SplashScreen):
             vpad=1
         )
 
-        super().__init__(text=banner_text, effect=effect, config=config)
+        self.text = banner_text
+        self.effect = effect
+        self.config = config
+
+        yield from super().compose()
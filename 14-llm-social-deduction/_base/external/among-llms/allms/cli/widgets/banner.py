@@ -22,7 +22,7 @@ class BannerWidget(Vertical):
         app_version = f"v{AppConfiguration.app_version}"
         app_ai_model = f"Powered by {self._config.ai_model}"
         banner_fmt = Banner.add_border(Banner.main_banner,
-                                       additional_lines=[app_version, "\n", app_ai_model],
+                                       additional_lines=(app_version, "\n", app_ai_model),
                                        hpad=2, vpad=0, pad_bottom=False)
         yield Static(banner_fmt)
         for line in AppConfiguration.app_tagline:
@@ -1,4 +1,7 @@
 import asyncio
+import math
+import time
+from collections import deque
 from typing import Optional
 
 from textual import on
@@ -27,14 +30,28 @@ from allms.core.state import GameStateManager
 class ChatroomWidget(Vertical):
     """ Class for the main chatroom widget """
 
-    BINDINGS = [
+    # Note: Ordering is only for display in the footer since bindings are looked up by key
+    # Quit needs priority as its key (ctrl+w) is otherwise consumed by the message box (delete word)
+    BINDINGS = (
         Binding(BindingConfiguration.chatroom_show_scenario, "view_scenario", "Scenario"),
         Binding(BindingConfiguration.chatroom_show_your_persona, "view_persona", "Your Persona"),
         Binding(BindingConfiguration.chatroom_show_all_persona, "view_all_personas", "All Personas"),
         Binding(BindingConfiguration.chatroom_modify_msgs, "modify_msgs", "Modify Messages"),
         Binding(BindingConfiguration.chatroom_start_vote, "start_a_vote", "Vote"),
         Binding(BindingConfiguration.chatroom_quit, "chatroom_quit", "Quit", priority=True)
-    ]
+    )
+
+    # Callback type -> (name-mangled) handler method, bound per instance when registering the callbacks
+    _CALLBACK_ATTRS = (
+        (ChatCallbackType.NEW_MESSAGE_RECEIVED, "_ChatroomWidget__update_new_chat_message"),
+        (ChatCallbackType.UPDATE_AGENTS_LIST, "_ChatroomWidget__update_agents_list"),
+        (ChatCallbackType.IS_TYPING, "_ChatroomWidget__is_typing"),
+        (ChatCallbackType.ANNOUNCE_EVENT, "_ChatroomWidget__event_occurred"),
+        (ChatCallbackType.NOTIFY_TOAST, "_ChatroomWidget__send_notification"),
+        (ChatCallbackType.TERMINATE_ALL_TASKS, "_ChatroomWidget__cancel_all_bg_tasks"),
+        (ChatCallbackType.GAME_HAS_ENDED, "_ChatroomWidget__game_has_officially_ended"),
+        (ChatCallbackType.CLOSE_CHATROOM, "_ChatroomWidget__close_chatroom")
+    )
 
     def __init__(self, config: RunTimeConfiguration, state_manager: GameStateManager, is_disabled: bool = False, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -50,6 +67,7 @@ class ChatroomWidget(Vertical):
         self._id_send_as_you = f"{self._your_agent_id} (You)"
 
         self._remaining_agents_widget = Static(id="chat-remaining-agents-widget")
+        self._last_counts: tuple[int, int] = (-1, -1)  # (remaining, terminated) last shown in the widget
 
         self._contents_widget = ChatroomContentsWidget(self._config, self._state_manager, display_you_as=self._id_send_as_you)
         self._is_typing_widget = ChatroomIsTyping()
@@ -59,6 +77,12 @@ class ChatroomWidget(Vertical):
         self._id_send_to_list = "chat-send-to-options"
         self._id_send_as_list = "chat-send-as-options"
 
+        # Maps the selection list IDs to the attribute storing its current value
+        self._select_value_attrs = {
+            self._id_send_as_list: "_current_send_as",
+            self._id_send_to_list: "_current_send_to"
+        }
+
         choices_send_to_tooltip = "Send to everyone or send a DM to a specific agent"
         choices_send_as_tooltip = "Send as you or masquerade as a different agent"
 
@@ -66,8 +90,10 @@ class ChatroomWidget(Vertical):
         # Note: We assume the first item to be the default, so ensure it is set to the correct value
         self._choices_send_to = []
         self._choices_send_as = []
-        self.__add_agents_to_selection_list(self._choices_send_to, first_item=self._id_send_to_all, prefix=self._prefix_send_to)
-        self.__add_agents_to_selection_list(self._choices_send_as, first_item=self._id_send_as_you, prefix=self._prefix_send_as)
+        self._remaining_cache_revision: int = -1
+        self._remaining_cache: tuple[str, ...] = ()
+        self._last_agents_signature: tuple[str, ...] = self._get_remaining_cached()
+        self.__populate_selection_lists(self._last_agents_signature)
 
         self._send_to_list = self.__create_choices(self._choices_send_to, widget_id=self._id_send_to_list, tooltip=choices_send_to_tooltip)
         self._send_as_list = self.__create_choices(self._choices_send_as, widget_id=self._id_send_as_list, tooltip=choices_send_as_tooltip)
@@ -88,6 +114,18 @@ class ChatroomWidget(Vertical):
         self._chat_worker: Optional[Worker] = None
         self._background_worker: Optional[Worker] = None
 
+        # Keeps strong references to in-flight message sends until they complete
+        self._pending_sends: set[asyncio.Task] = set()
+
+        # Last shown time (monotonic) of the notifications for suppressing identical toasts in quick succession
+        self._recent_notifications: dict[tuple[str, str, str], float] = {}
+        self._notification_dedup_ttl: float = 2.0
+
+        # Messages (by ID) and events waiting to be added to the chat, as (item, is event). These are added once per
+        # frame, or when the chatroom is resumed if they were received while a screen is on top of the chatroom
+        self._deferred_entries: deque[tuple[str, bool]] = deque()
+        self._flush_scheduled: bool = False
+
     def on_show(self) -> None:
         # Show what the agent the user has been assigned
         if not self._is_disabled:
@@ -136,52 +174,83 @@ class ChatroomWidget(Vertical):
 
     def __show_assignment_screen(self) -> None:
         """ Helper method to show the assignment screen """
-        your_agent_id = self._state_manager.get_user_assigned_agent_id()
-        screen_title = f"You are {your_agent_id}"
+        screen_title = f"You are {self._your_agent_id}"
         self.app.push_screen(YourAgentAssignmentScreen(screen_title, self._config, self._state_manager))
 
-    def __add_agents_to_selection_list(self, choices_list: list[tuple[str, str]], first_item: str, prefix: str) -> None:
+    def __populate_selection_lists(self, agent_ids: tuple[str, ...]) -> None:
+        """ Helper method to populate both the send-to and send-as choices from the given agent IDs """
+        your_agent_id = self._your_agent_id
+        self.__add_agents_to_selection_list(self._choices_send_to, agent_ids, your_agent_id,
+                                            first_item=self._id_send_to_all, prefix=self._prefix_send_to)
+        self.__add_agents_to_selection_list(self._choices_send_as, agent_ids, your_agent_id,
+                                            first_item=self._id_send_as_you, prefix=self._prefix_send_as)
+
+    @staticmethod
+    def __add_agents_to_selection_list(choices_list: list[tuple[str, str]], agent_ids: tuple[str, ...], your_agent_id: str,
+                                       first_item: str, prefix: str) -> None:
         """ Helper method to add agent selection choices to the given list """
-        choices_list.clear()  # Need to do this to ensure when an agent is kicked out, it is reflected in the choices
-        agent_ids = self._state_manager.get_all_remaining_agents_ids()
-        your_agent_id = self._state_manager.get_user_assigned_agent_id()
-
-        for aid in [first_item] + agent_ids:
-            if aid == your_agent_id:
-                continue
-            item = (f"{prefix} {aid}", aid)
-            choices_list.append(item)
+        ids = [first_item, *[aid for aid in agent_ids if aid != your_agent_id]]
+        # Note: Replace the contents in-place so that the list object is reused; when an agent is kicked out,
+        # it is reflected in the choices
+        choices_list[:] = [(f"{prefix} {aid}" if prefix else aid, aid) for aid in ids]
+
+    def _get_remaining_cached(self) -> tuple[str, ...]:
+        """ Returns the remaining agent IDs, re-fetching them only when the agents revision has changed """
+        revision = self._state_manager.agents_revision
+        if revision != self._remaining_cache_revision:
+            self._remaining_cache = tuple(self._state_manager.get_all_remaining_agents_ids())
+            self._remaining_cache_revision = revision
+        return self._remaining_cache
 
     def __update_remaining_agent_counts(self) -> None:
         """ Helper method to update the remaining agents text widget """
-        n_remaining = len(self._state_manager.get_all_remaining_agents_ids()) - 1  # Ignore yourself
-        n_terminated = len(self._state_manager.get_all_agents()) - n_remaining - 1
+        n_remaining = len(self._get_remaining_cached()) - 1  # Ignore yourself
+        n_terminated = self._state_manager.get_terminated_count()
 
-        text = f"Remaining: [b]{n_remaining}[/]; Terminated: [b]{n_terminated}[/]"
-        self._remaining_agents_widget.update(text)
+        counts = (n_remaining, n_terminated)
+        if counts == self._last_counts:
+            return
+
+        self._last_counts = counts
+        counts_text = f"Remaining: [b]{n_remaining}[/]; Terminated: [b]{n_terminated}[/]"
+        self._remaining_agents_widget.update(counts_text)
 
     def __generate_callbacks(self) -> dict:
         """ Generates the callback mapping and returns it """
-        callback_map = {
-            ChatCallbackType.NEW_MESSAGE_RECEIVED: self.__update_new_chat_message,
-            ChatCallbackType.UPDATE_AGENTS_LIST: self.__update_agents_list,
-            ChatCallbackType.IS_TYPING: self.__is_typing,
-            ChatCallbackType.ANNOUNCE_EVENT: self.__event_occurred,
-            ChatCallbackType.NOTIFY_TOAST: self.__send_notification,
-            ChatCallbackType.TERMINATE_ALL_TASKS: self.__cancel_all_bg_tasks,
-            ChatCallbackType.GAME_HAS_ENDED: self.__game_has_officially_ended,
-            ChatCallbackType.CLOSE_CHATROOM: self.__close_chatroom
-        }
+        return {callback_type: getattr(self, attr) for callback_type, attr in self._CALLBACK_ATTRS}
+
+    @property
+    def _is_foreground(self) -> bool:
+        """ Returns whether the chatroom is on the screen currently shown """
+        return not self.app.screen_stack or self.app.screen_stack[-1] is self.screen
+
+    def flush_deferred_entries(self) -> None:
+        """ Adds the deferred messages and events to the chat in a single batch """
+        self._flush_scheduled = False
+        if not self._deferred_entries or not self._is_foreground:
+            return
 
-        return callback_map
+        entries = list(self._deferred_entries)
+        self._deferred_entries.clear()
+        self._contents_widget.add_new_entries(entries)
 
     def __update_new_chat_message(self, msg_id: str) -> None:
         """ Callback method to display the message with the given ID to the widget """
         # Note: Do not call this method directly, instead use the state manager to invoke this callback
-        self._contents_widget.add_new_message(msg_id)
+        self.__queue_entry(msg_id, is_event=False)
+
+    def __queue_entry(self, item: str, is_event: bool) -> None:
+        """ Helper method to queue a message or event so that bursts are added with a single re-layout """
+        self._deferred_entries.append((item, is_event))
+
+        # Avoid re-layouts of the hidden chat while a modal is on top; these are added once the chatroom is resumed
+        if self._is_foreground and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.call_after_refresh(self.flush_deferred_entries)
 
     def __is_typing(self, agent_id: str, is_typing: bool) -> None:
         """ Callback method to update the current agents typing """
+        # Note: The typing widget queues the change and updates the indicator at most once per frame
         if is_typing:
             self._is_typing_widget.add_typing(agent_id)
         else:
@@ -189,10 +258,21 @@ class ChatroomWidget(Vertical):
 
     def __event_occurred(self, event: str) -> None:
         """ Callback method to display the event on the screen """
-        self._contents_widget.announce_event(event)
+        # Note: Events are queued as well so that they stay in order with the messages
+        self.__queue_entry(event, is_event=True)
 
     def __send_notification(self, title: str, message: str, severity: str = ToastConfiguration.type_information) -> None:
         """ Callback method to send a notification toast """
+        # Drop the toast if an identical one was shown very recently
+        key = (title, message, severity)
+        now = time.monotonic()
+        if now - self._recent_notifications.get(key, -math.inf) < self._notification_dedup_ttl:
+            return
+
+        if len(self._recent_notifications) > 64:
+            self._recent_notifications = {k: ts for k, ts in self._recent_notifications.items() if now - ts < 30.0}
+
+        self._recent_notifications[key] = now
         self.notify(title=title, message=message, severity=severity)
 
     def __cancel_all_bg_tasks(self) -> None:
@@ -219,8 +299,14 @@ class ChatroomWidget(Vertical):
 
     def __update_agents_list(self) -> None:
         """ Callback method to update the remaining agents from the lists """
-        self.__add_agents_to_selection_list(self._choices_send_to, first_item=self._id_send_to_all, prefix=self._prefix_send_to)
-        self.__add_agents_to_selection_list(self._choices_send_as, first_item=self._id_send_as_you, prefix=self._prefix_send_as)
+        # Skip rebuilding the selection lists (and re-rendering them) if the remaining agents have not changed
+        signature = self._get_remaining_cached()
+        if signature == self._last_agents_signature:
+            self.__update_remaining_agent_counts()
+            return
+
+        self._last_agents_signature = signature
+        self.__populate_selection_lists(signature)
 
         self._send_to_list.set_options(self._choices_send_to)
         self._send_as_list.set_options(self._choices_send_as)
@@ -236,20 +322,23 @@ class ChatroomWidget(Vertical):
     def handler_user_text_message_changed(self, event: Input.Changed) -> None:
         """ Handler invoked when there is a change in message box """
         input_text = event.input.value
+        # Skip repeated identical change events (e.g. on focus toggles)
+        if input_text == self._current_msg:
+            return
+
         self._current_msg = input_text
 
     @on(Select.Changed)
     def handler_select_item_changed(self, event: Select.Changed) -> None:
         """ Handler invoked when there is a change in the select item for either of the choices list """
         select_widget = event.select
-        if select_widget.id == self._id_send_as_list:
-            self._current_send_as = self._send_as_list.value
-        elif select_widget.id == self._id_send_to_list:
-            self._current_send_to = self._send_to_list.value
-        else:
+        attr = self._select_value_attrs.get(select_widget.id)
+        if attr is None:
             # Should not arrive at this branch or else there is a bug
             raise RuntimeError(f"Received unexpected id({select_widget.id}) on selection list handler")
 
+        setattr(self, attr, select_widget.value)
+
     @on(Button.Pressed)
     def handler_send_button_clicked(self, event: Button.Pressed) -> None:
         """ Handler invoked when send button is clicked """
@@ -300,7 +389,9 @@ class ChatroomWidget(Vertical):
             msg_id = await self._state_manager.send_message(msg=current_msg, sent_by=send_as, sent_to=send_to, sent_by_you=sent_by_you)
             await self._state_manager.on_new_message_received(msg_id)
 
-        asyncio.gather(_send())
+        task = asyncio.create_task(_send())
+        self._pending_sends.add(task)
+        task.add_done_callback(self._pending_sends.discard)
         # TODO: What if the user is replying to an older message? I guess the chat-contents class should take care of this
 
         # Finally reset the current text
@@ -315,8 +406,7 @@ class ChatroomWidget(Vertical):
 
         screen_title = "Modify Messages"
         screen = ModifyMessageScreen(screen_title, self._config, self._state_manager,
-                                     widget_params=dict(chat_msg_edit_callback=self._contents_widget.edit_message,
-                                                        chat_msg_delete_callback=self._contents_widget.delete_message))
+                                     widget_params=dict(chat_msgs_modified_callback=self._contents_widget.refresh_modified_messages))
         self.app.push_screen(screen)
 
     def action_chatroom_quit(self) -> None:
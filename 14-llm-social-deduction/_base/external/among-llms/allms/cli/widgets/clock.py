@@ -1,4 +1,5 @@
-from textual.app import ComposeResult
+import time
+
 from textual.widgets import Static
 
 from allms.config import AppConfiguration
@@ -7,16 +8,31 @@ from allms.config import AppConfiguration
 class ChatClock(Static):
     """ Class for the clock widget """
 
+    # Timestamp format: Mon 28 Apr 2025, 13:54:47
+    _fmt = "%a %d %B %Y, %H:%M:%S"
+
     def __init__(self):
         super().__init__()
+        self._current_timestamp = AppConfiguration.clock.current_timestamp_in_given_format
+        self._last_rendered = ""
         self._update_time()
 
     def on_mount(self) -> None:
+        self._tick()
+
+    @staticmethod
+    def _delay_to_next_second() -> float:
+        """ Returns the delay (in seconds) until the next wall-clock second boundary """
+        return 1.0 - (time.time() % 1.0)
+
+    def _tick(self) -> None:
+        """ Method to refresh the clock and re-arm the timer aligned to the next second """
         self._update_time()
-        self.set_interval(1.0, self._update_time)
+        self.set_timer(self._delay_to_next_second(), self._tick)
 
     def _update_time(self) -> None:
-        """ Method to update the timestamp on every call """
-        # Timestamp format: Mon 28 Apr 2025, 13:54:47
-        time = AppConfiguration.clock.current_timestamp_in_given_format("%a %d %B %Y, %H:%M:%S")
-        self.update(time)
+        """ Method to update the timestamp only if the rendered text has changed """
+        timestamp = self._current_timestamp(self._fmt)
+        if timestamp != self._last_rendered:
+            self._last_rendered = timestamp
+            self.update(timestamp)
@@ -1,8 +1,11 @@
-from typing import Optional
+import asyncio
+import itertools
+from typing import Iterable, Optional
 
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical, VerticalScroll
-from textual.widget import Widget
+from textual.timer import Timer
+from textual.widget import AwaitMount, Widget
 from textual.widgets import Label, Static
 
 from allms.config import StyleConfiguration, RunTimeConfiguration
@@ -10,6 +13,69 @@ from allms.core.state import GameStateManager
 from allms.core.chat import ChatMessage
 
 
+def _edited_text(edited: bool, deleted: bool, edited_by_you: bool, deleted_by_you: bool, your_message: bool) -> str:
+    """ Returns the edited/deleted marker shown in the border title of a chat bubble """
+    edited_text = ""
+    if edited:
+        by_you_text = " by you" if (edited_by_you and not your_message) else ""
+        edited_text = f"[i](edited{by_you_text})[/]"
+    if deleted:
+        by_you_text = " by you" if (deleted_by_you and not your_message) else ""
+        edited_text = f"[i](deleted{by_you_text})[/]"
+    return edited_text
+
+
+# Marker for every (edited, deleted, edited_by_you, deleted_by_you, your_message) combination, built once at import
+_EDITED_TEXT_LUT: dict[tuple[bool, bool, bool, bool, bool], str] = {
+    key: _edited_text(*key) for key in itertools.product((False, True), repeat=5)
+}
+
+
+def _render_extra_text(config: RunTimeConfiguration, message: ChatMessage, your_message: bool) -> str:
+    """ Returns the extra info (intent and suspect) shown below the message of a chat bubble """
+    extra_txt = ""
+    thought_process = message.thought_process
+    suspect = "-"
+    suspect_confidence = "-"
+    suspect_reason = "-"
+
+    if message.suspect is not None:
+        suspect = message.suspect
+        suspect_confidence = message.suspect_confidence
+        suspect_reason = message.suspect_reason
+
+    if config.show_thought_process and not your_message:
+        extra_txt = f"[italic dim]([b]Intent[/]: {thought_process})[/]"
+
+    # Show suspects only if config allows, it was not sent by you and the message contains a suspect
+    if config.show_suspects and not your_message and (message.suspect is not None):
+        suspect_txt = f"[dim][b]Suspect[/]:    {suspect}[/]\n" + \
+                      f"[dim][b]Confidence[/]: {suspect_confidence}[/]\n" + \
+                      f"[dim][b]Reason[/]:     {suspect_reason}[/]\n"
+        extra_txt = f"{extra_txt}\n\n{suspect_txt}"
+
+    return extra_txt
+
+
+def _render_border_title(message: ChatMessage, your_message: bool, sent_by: str) -> str:
+    """ Returns the border title of a chat bubble """
+    title_suffix = "/[i]hacked[/]" if message.sent_by_you and (not your_message) else ""
+    if message.sent_to is not None:
+        title_suffix += f" -> {message.sent_to}"
+
+    edited_text = _EDITED_TEXT_LUT[(message.edited, message.deleted, message.edited_by_you, message.deleted_by_you, your_message)]
+    return f"{sent_by}{title_suffix} {edited_text}"
+
+
+def _render_bubble_texts(config: RunTimeConfiguration, message: ChatMessage, your_message: bool, sent_by: str) -> tuple[str, str, str, str]:
+    """
+    Returns the (message, extra info, border title, border subtitle) texts of a chat bubble
+    Only builds plain strings (no widgets), so it is safe to run in a thread
+    """
+    return (message.msg, _render_extra_text(config, message, your_message),
+            _render_border_title(message, your_message, sent_by), str(message.timestamp))
+
+
 class ChatBubbleWidget(Container):
     """ Class for a widget hosting a single message """
     def __init__(self,
@@ -18,6 +84,7 @@ class ChatBubbleWidget(Container):
                  state_manager: GameStateManager,
                  your_message: bool,
                  sent_by: str,
+                 rendered_texts: Optional[tuple[str, str, str, str]] = None,
                  *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._config = config
@@ -25,7 +92,8 @@ class ChatBubbleWidget(Container):
         self._state_manager = state_manager
         self._your_message = your_message
         self._sent_by = sent_by
-        self._container = Vertical()
+        # Note: Classes are set at construction so the bubble is styled without a separate class mutation on compose
+        self._container = Vertical(classes=StyleConfiguration.class_border)
         self._chat_bubble: Optional[Static] = None
         self._extra_bubble: Optional[Static] = None
 
@@ -37,88 +105,70 @@ class ChatBubbleWidget(Container):
         bubble_alignment = "right" if self._your_message else "left"
         self.styles.align = bubble_alignment, "middle"
 
-    def compose(self) -> ComposeResult:
-        msg_txt = self._message.msg
-        extra_txt = ""
-        thought_process = self._message.thought_process
-        suspect = "-"
-        suspect_confidence = "-"
-        suspect_reason = "-"
-
-        with self._container:
-            if self._message.suspect is not None:
-                suspect = self._message.suspect
-                suspect_confidence = self._message.suspect_confidence
-                suspect_reason = self._message.suspect_reason
+        # Rendered texts of the bubble, refreshed only when the message is edited or deleted
+        self._rendered_msg: str = ""
+        self._rendered_extra: str = ""
+        self._rendered_title: str = ""
+        self._rendered_subtitle: str = ""
+        if rendered_texts is None:
+            self._render_texts()
+        else:  # Already rendered beforehand (e.g. when loading the chat history)
+            self._rendered_msg, self._rendered_extra, self._rendered_title, self._rendered_subtitle = rendered_texts
 
-            if self._config.show_thought_process and not self._your_message:
-                extra_txt = f"[italic dim]([b]Intent[/]: {thought_process})[/]"
+        # What is currently displayed, to skip repaints on edits that do not change anything
+        self._last_msg_rendered: str = ""
+        self._last_title: tuple[str, str] = ("", "")
 
-            # Show suspects only if config allows, it was not sent by you and the message contains a suspect
-            if self._config.show_suspects and not self._your_message and (self._message.suspect is not None):
-                suspect_txt = f"[dim][b]Suspect[/]:    {suspect}[/]\n" + \
-                              f"[dim][b]Confidence[/]: {suspect_confidence}[/]\n" + \
-                              f"[dim][b]Reason[/]:     {suspect_reason}[/]\n"
-                extra_txt = f"{extra_txt}\n\n{suspect_txt}"
-
-            self._chat_bubble = Static(msg_txt)
-            self._extra_bubble = Static(extra_txt)
+    def compose(self) -> ComposeResult:
+        with self._container:
+            self._chat_bubble = Static(self._rendered_msg)
 
-            title, subtitle = self.__create_border_title_subtitle()
-            self._container.add_class(StyleConfiguration.class_border)
-            self.__add_border_text(title, subtitle, self._container)
+            self._refresh_border()
+            self._last_msg_rendered = self._rendered_msg
 
             yield self._chat_bubble
-            if not self._message.sent_by_you:
+            # Only create the extra bubble if there is something to show in it
+            if self._rendered_extra and not self._message.sent_by_you:
+                self._extra_bubble = Static(self._rendered_extra)
                 yield self._extra_bubble
         yield self._container
 
     def edit_contents(self) -> None:
         """ Edits the contents of the chat bubble with the new contents """
-        self._chat_bubble.update(self._message.msg)
-        title, subtitle = self.__create_border_title_subtitle()
-        self.__add_border_text(title, subtitle, self._container)
+        self._render_texts()
+        if self._chat_bubble is None:
+            return  # Not composed yet, compose uses the re-rendered texts
+        new_title = (self._rendered_title, self._rendered_subtitle)
+
+        # Skip the repaint if the edit did not change anything that is displayed
+        if self._rendered_msg == self._last_msg_rendered and new_title == self._last_title:
+            return
+
+        self._chat_bubble.update(self._rendered_msg)
+        self._refresh_border()
+        self._last_msg_rendered = self._rendered_msg
 
     def delete_contents(self) -> None:
         """ Deletes the contents of the chat bubble """
-        new_content = f"[i]{self._message.msg}[/]"  # Already must have been updated by the state manager
+        self._render_texts()
+        if self._chat_bubble is None:
+            return  # Not composed yet, compose uses the re-rendered texts
+        new_content = f"[i]{self._rendered_msg}[/]"  # Already must have been updated by the state manager
         self._chat_bubble.update(new_content)
-        title, subtitle = self.__create_border_title_subtitle()
-        self.__add_border_text(title, subtitle)
-
-    @staticmethod
-    def __add_border_text(title: str, subtitle: str, widget: Container | Widget) -> None:
-        """ Helper method to add border title and subtitle to the chat bubble """
-        widget.border_title = title
-        widget.border_subtitle = subtitle
-
-    def __create_border_title_subtitle(self) -> tuple[str, str]:
-        """ Helper method to create the border text and returns it """
-        msg_time = self._message.timestamp
-        sent_by = self._sent_by
-        sent_to = self._message.sent_to
-        sent_by_you = self._message.sent_by_you
-        edited = self._message.edited
-        edited_by_you = self._message.edited_by_you
-        deleted = self._message.deleted
-        deleted_by_you = self._message.deleted_by_you
-
-        title_suffix = "/[i]hacked[/]" if sent_by_you and (not self._your_message) else ""
-        if sent_to is not None:
-            title_suffix += f" -> {sent_to}"
-
-        edited_text = ""
-        if edited:
-            by_you_text = " by you" if (edited_by_you and not self._your_message) else ""
-            edited_text = f"[i](edited{by_you_text})[/]"
-        if deleted:
-            by_you_text = " by you" if (deleted_by_you and not self._your_message) else ""
-            edited_text = f"[i](deleted{by_you_text})[/]"
-
-        border_title = f"{sent_by}{title_suffix} {edited_text}"
-        border_subtitle = f"{msg_time}"
-
-        return border_title, border_subtitle
+        self._refresh_border()
+        self._last_msg_rendered = new_content
+
+    def _render_texts(self) -> None:
+        """ Renders the message, extra info and border texts from the message (only needed when it changes) """
+        (self._rendered_msg, self._rendered_extra,
+         self._rendered_title, self._rendered_subtitle) = _render_bubble_texts(self._config, self._message,
+                                                                               self._your_message, self._sent_by)
+
+    def _refresh_border(self) -> None:
+        """ Applies the (already rendered) border title and subtitle to the chat bubble """
+        self._container.border_title = self._rendered_title
+        self._container.border_subtitle = self._rendered_subtitle
+        self._last_title = (self._rendered_title, self._rendered_subtitle)
 
 
 class ChatroomContentsWidget(VerticalScroll):
@@ -133,55 +183,115 @@ class ChatroomContentsWidget(VerticalScroll):
 
         self._css_class_announcement_widget = "chatroom-announcement-widget"
         self._css_class_announcement_container = "chatroom-announcement-container"
+        self._announcement_widget_kwargs = {"classes": self._css_class_announcement_widget}
+        self._announcement_container_kwargs = {"classes": self._css_class_announcement_container}
 
         # Mapping between a message ID, and it's corresponding chat-bubble widget
         self._msg_map: dict[str, ChatBubbleWidget] = {}
 
-    def on_mount(self) -> None:
-        # Add the messages and announcements if there are any (in the case of load chatroom)
-        msgs: list[ChatMessage] = self._state_manager.get_all_messages()
-        for msg in msgs:
-            if not msg.is_announcement:
-                self.add_new_message(msg)
-            else:
-                self.announce_event(msg.msg)
-
-    def add_new_message(self, msg: str | ChatMessage) -> None:
-        """ Method to add a new chat message to the widget """
-        if isinstance(msg, str):
-            msg = self._state_manager.get_message(msg)
-
-        msg_id = msg.id
-        your_msg = (msg.sent_by == self._your_agent_id)
-        sent_by = msg.sent_by
-        if your_msg:  # If sending as yourself, update the display name to reflect it
-            sent_by = self._display_you_as
-
-        msg_widget = ChatBubbleWidget(self._config, msg, self._state_manager, your_message=your_msg, sent_by=sent_by)
-        self._msg_map[msg_id] = msg_widget
-        self.__add_widget_to_screen(msg_widget)
+        # Widgets waiting to be mounted; bursts arriving within the flush delay are mounted together
+        self._pending_widgets: list[Widget] = []
+        self._flush_handle: Optional[Timer] = None
+        self._flush_delay: float = 0.05
 
-    async def edit_message(self, msg_id: str) -> None:
-        """ Method to edit an existing chat message """
-        msg_widget = self._msg_map[msg_id]
-        msg_widget.edit_contents()
+        # Whether the stored messages (in the case of load chatroom) have been mounted; new ones wait for them
+        self._history_loaded: bool = False
+        self._history_chunk_size: int = 100  # No. of stored messages turned into widgets before yielding to the UI
 
-    async def delete_message(self, msg_id: str) -> None:
-        """ Method to delete an existing chat message """
-        msg_widget = self._msg_map[msg_id]
-        msg_widget.delete_contents()
+    async def on_mount(self) -> None:
+        # Add the messages and announcements if there are any (in the case of load chatroom)
+        # Note: Only the texts of the chat bubbles are rendered in a thread (widgets are not thread-safe), the widgets are
+        # then built here in chunks, so large save files do not block the UI
+        msgs: list[ChatMessage] = self._state_manager.get_all_messages()
+        if msgs:
+            rendered = await asyncio.to_thread(self.__render_history_texts, msgs)
+            pending: list[Widget] = []
+            for i, (msg, texts) in enumerate(zip(msgs, rendered), start=1):
+                if texts is None:
+                    pending.append(self.__create_announcement_widget(msg.msg))
+                else:
+                    pending.append(self.__create_message_widget(msg, rendered_texts=texts))
+                if i % self._history_chunk_size == 0:
+                    await asyncio.sleep(0)
+            # Messages that arrived while loading were queued after the history, keep them after it
+            pending.extend(self._pending_widgets)
+            self._pending_widgets = []
+            await self.__add_widgets_to_screen(pending)
+        self._history_loaded = True
+
+    def __render_history_texts(self, msgs: list[ChatMessage]) -> list[Optional[tuple[str, str, str, str]]]:
+        """ Helper method to render the bubble texts of the stored messages (None for announcements), runs in a thread """
+        return [None if msg.is_announcement else _render_bubble_texts(self._config, msg, *self.__get_sender(msg))
+                for msg in msgs]
+
+    def add_new_entries(self, entries: Iterable[tuple[str, bool]]) -> None:
+        """ Method to add the given (message ID or event text, is event) entries in order with a single mount """
+        get_message = self._state_manager.get_message
+        widgets = [self.__create_announcement_widget(item) if is_event else self.__create_message_widget(get_message(item))
+                   for item, is_event in entries]
+        if widgets:
+            self.__queue_widgets(widgets)
+
+    async def refresh_modified_messages(self, edited_ids: Iterable[str], deleted_ids: Iterable[str]) -> None:
+        """ Method to update the existing chat messages that were edited or deleted, in a single pass """
+        await self.__flush_pending()
+        msg_map = self._msg_map
+        for msg_id in edited_ids:
+            msg_widget = msg_map.get(msg_id)
+            if msg_widget is not None:  # Skip the ones not displayed yet (deferred)
+                msg_widget.edit_contents()
+        for msg_id in deleted_ids:
+            msg_widget = msg_map.get(msg_id)
+            if msg_widget is not None:
+                msg_widget.delete_contents()
 
     def announce_event(self, event: str) -> None:
         """ Callback method that adds the event to the chat screen """
         widget = self.__create_announcement_widget(event)
-        self.__add_widget_to_screen(widget)
+        self.__queue_widgets([widget])
+
+    def __create_message_widget(self, msg: ChatMessage, rendered_texts: Optional[tuple[str, str, str, str]] = None) -> ChatBubbleWidget:
+        """ Helper method to create (and keep track of) the chat bubble widget for the given message """
+        your_msg, sent_by = self.__get_sender(msg)
+        msg_widget = ChatBubbleWidget(self._config, msg, self._state_manager, your_message=your_msg, sent_by=sent_by,
+                                      rendered_texts=rendered_texts)
+        self._msg_map[msg.id] = msg_widget
+        return msg_widget
+
+    def __get_sender(self, msg: ChatMessage) -> tuple[bool, str]:
+        """ Helper method to return whether the message is yours, and the sender name to display """
+        your_msg = (msg.sent_by == self._your_agent_id)
+        sent_by = msg.sent_by
+        if your_msg:  # If sending as yourself, update the display name to reflect it
+            sent_by = self._display_you_as
+        return your_msg, sent_by
 
     def __create_announcement_widget(self, msg: str) -> Container:
         """ Helper method to create a widget for the voting status """
-        widget = Static(msg, classes=self._css_class_announcement_widget)
-        return Container(widget, classes=self._css_class_announcement_container)
-
-    def __add_widget_to_screen(self, widget: ChatBubbleWidget | Widget | Container) -> None:
-        """ Helper method to add the given widget to the screen """
-        self.mount(widget)
-        self.scroll_end(animate=False)
+        # Note: Every announcement needs its own widgets (a widget can only be mounted once), only the arguments are shared
+        return Container(Static(msg, **self._announcement_widget_kwargs), **self._announcement_container_kwargs)
+
+    def __queue_widgets(self, widgets: list[ChatBubbleWidget | Widget | Container]) -> None:
+        """ Helper method to queue the given widgets and schedule them to be mounted after a short delay """
+        self._pending_widgets.extend(widgets)
+        if self._flush_handle is None:
+            self._flush_handle = self.set_timer(self._flush_delay, self.__flush_pending)
+
+    async def __flush_pending(self) -> None:
+        """ Helper method to mount all the queued widgets at once """
+        if self._flush_handle is not None:
+            self._flush_handle.stop()
+            self._flush_handle = None
+
+        if not self._history_loaded or not self._pending_widgets:
+            return  # Still loading, the queued widgets are mounted together with the stored messages
+
+        batch, self._pending_widgets = self._pending_widgets, []
+        await self.__add_widgets_to_screen(batch)
+
+    def __add_widgets_to_screen(self, widgets: list[ChatBubbleWidget | Widget | Container]) -> AwaitMount:
+        """ Helper method to add the given widgets to the screen (in a single mount) """
+        await_mount = self.mount_all(widgets)
+        # Only bring the last new widget into view once laid out, instead of measuring the full scroll extent
+        self.call_after_refresh(widgets[-1].scroll_visible, animate=False)
+        return await_mount
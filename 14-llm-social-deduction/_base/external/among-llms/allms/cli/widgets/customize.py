@@ -7,7 +7,6 @@ from textual.containers import Horizontal, VerticalScroll
 from textual.widgets import Label, TextArea, Select, Button
 
 from allms.config import BindingConfiguration, RunTimeConfiguration
-from allms.core.agents import AgentFactory
 from allms.core.state import GameStateManager
 from .modal import ModalScreenWidget
 
@@ -22,7 +21,7 @@ class CustomizeAgentsWidget(ModalScreenWidget):
         super().__init__(title, config, state_manager, *args, **kwargs)
         self._read_only = read_only
         self._all_agents = self._state_manager.get_all_agents()
-        self._agent_ids = sorted(list(self._all_agents.keys()), key=AgentFactory.agent_id_comparator)
+        self._agent_ids = self._state_manager.get_sorted_agent_ids()
 
         self._id_btn_confirm = "customize-agent-confirm-btn"
         self._id_btn_cancel = "customize-agent-cancel-btn"
@@ -38,7 +37,7 @@ class CustomizeAgentsWidget(ModalScreenWidget):
             self._bindings = BindingsMap()
 
     def compose(self) -> ComposeResult:
-        agent_ids = [(aid, aid) for aid in self._agent_ids]
+        agent_ids = self._state_manager.get_agent_id_options()
         default_agent_id = self._agent_ids[0]
         default_text = self._all_agents[default_agent_id].persona
 
@@ -12,6 +12,25 @@ from allms.core.state import GameStateManager
 from .modal import ModalScreenWidget
 
 
+_EXIT_MSGS: tuple[str, ...] = (
+    "Time to byte the dust? Save or exit without a trace?",
+    "Ctrl + Alt + Escape? Save your stealth or ghost the bots?",
+    "Abort mission or save your data? Don’t let the bots RAM your progress!",
+    "Logging out ... don’t let the AI catch your cache!",
+    "You’re about to commit ... to exiting. Save first?",
+    "Press save before the bots debug your disappearance!",
+    "Exit without saving? Hope the bots don’t catch your residuals!",
+    "Ghost the bots or save your moves? The choice is yours!",
+    "Save & vanish or let the AI process your mistakes?",
+    "You’re about to logout ... don’t let the bots CTRL your fate!",
+    "Quick! Save before the AI does a hard reset on your progress!",
+    "Exit without saving? The bots will have a field day!",
+    "Save or vanish ... choose wisely, agent human!",
+    "Don’t let the AI byte your unsaved progress!",
+    "Save & escape or leave it for the bots to parse?"
+)
+
+
 class ChatExitWidget(ModalScreenWidget):
 
     def __init__(self, title: str, config: RunTimeConfiguration, state_manager: GameStateManager, callbacks: ChatCallbacks, *args, **kwargs):
@@ -19,26 +38,9 @@ class ChatExitWidget(ModalScreenWidget):
         self._callbacks = callbacks
         self._id_btn_save_and_exit = "exit-btn-export-and-save"
         self._id_btn_exit_no_save = "exit-btn-direct-exit"
-        self._exit_msgs = [
-            "Time to byte the dust? Save or exit without a trace?",
-            "Ctrl + Alt + Escape? Save your stealth or ghost the bots?",
-            "Abort mission or save your data? Don’t let the bots RAM your progress!",
-            "Logging out ... don’t let the AI catch your cache!",
-            "You’re about to commit ... to exiting. Save first?",
-            "Press save before the bots debug your disappearance!",
-            "Exit without saving? Hope the bots don’t catch your residuals!",
-            "Ghost the bots or save your moves? The choice is yours!",
-            "Save & vanish or let the AI process your mistakes?",
-            "You’re about to logout ... don’t let the bots CTRL your fate!",
-            "Quick! Save before the AI does a hard reset on your progress!",
-            "Exit without saving? The bots will have a field day!",
-            "Save or vanish ... choose wisely, agent human!",
-            "Don’t let the AI byte your unsaved progress!",
-            "Save & escape or leave it for the bots to parse?"
-        ]
 
     def compose(self) -> ComposeResult:
-        end_text = random.choice(self._exit_msgs)
+        end_text = random.choice(_EXIT_MSGS)
         end_widget = Static(end_text)
         confirm_btn, cancel_btn = self._create_confirm_cancel_buttons(
             confirm_btn_id=self._id_btn_save_and_exit,
@@ -1,4 +1,6 @@
+import functools
 import logging
+import os
 from pathlib import Path
 from typing import Callable, Iterable
 
@@ -13,21 +15,32 @@ from allms.core.state import GameStateManager
 from .modal import ModalScreenWidget
 
 
+@functools.lru_cache(maxsize=256)
+def _split_display_path(path_str: str, name: str, max_width: int) -> tuple[str, str]:
+    """ Returns the (truncated parent, name) parts of the path to display within the given width """
+    padding = 12
+    available = max_width - padding
+    truncated = path_str if len(path_str) <= available else "..." + path_str[-max(available - 3, len(name)):]
+    # Split on the last separator instead of replacing the name, which may also occur in a parent directory
+    parent_str, sep, _ = truncated.rpartition(os.sep)
+    return parent_str + sep, name
+
+
 class _FilterDirectoryTree(DirectoryTree):
     """ Directory tree to only show JSON files """
 
     def __init__(self, path: str | Path, allow_file_types: list[str] = None):
         super().__init__(path)
         self._allow_file_types = allow_file_types
+        # Suffixes (with the leading dot) to compare directly against Path.suffix
+        self._allowed_suffixes: frozenset[str] = frozenset("." + t.lower() for t in (allow_file_types or ()))
 
     def filter_paths(self, paths: Iterable[Path]) -> Iterable[Path]:
-        def _filter_condition(path: Path) -> bool:
-            """ Helper method for filtering files """
-            if self._allow_file_types:
-                return path.suffix.strip(".").lower() in self._allow_file_types
-            return True
+        if not self._allowed_suffixes:
+            return paths
 
-        return [path for path in paths if path.is_dir() or _filter_condition(path)]
+        allowed_suffixes = self._allowed_suffixes
+        return [path for path in paths if path.is_dir() or path.suffix.lower() in allowed_suffixes]
 
 
 class LoadGameStateWidget(ModalScreenWidget):
@@ -121,13 +134,11 @@ class LoadGameStateWidget(ModalScreenWidget):
 
     def __create_rich_text_path(self, path: Path) -> Text:
         """ Helper method to create a rich renderable for the given path """
-        max_width = self.size.width
-        padding = 12
-        value = "..." + str(path)[-max_width + padding:]
-        parent_str = value.replace(path.name, "")
+        parent_str, name = _split_display_path(os.fspath(path), path.name, self.size.width)
 
+        # Note: Text is mutable, so only the strings are cached and a new renderable is built every time
         text = Text()
         text.append(parent_str, style="dim")
-        text.append(path.name, style="bold")
+        text.append(name, style="bold")
 
         return text
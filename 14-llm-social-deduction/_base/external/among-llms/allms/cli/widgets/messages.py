@@ -14,6 +14,12 @@ from allms.core.state import GameStateManager
 from allms.core.chat import ChatMessage
 
 
+class ModifyMessageAction:
+    """ Class holding the kinds of modification pending on a message """
+    EDIT: str = "edit"
+    DELETE: str = "delete"
+
+
 @dataclass
 class ModifyMessageOptionItemRenderable:
     """ Class for rendering each main-menu item in the list """
@@ -56,14 +62,12 @@ class ModifyMessageOptionListWidget(OptionList):
     def __init__(self,
                  config: RunTimeConfiguration,
                  state_manager: GameStateManager,
-                 edited_msgs_map: dict[str, str],
-                 delete_msgs_set: set[str],
+                 msg_state: dict[str, tuple[str, Optional[str]]],
                  item_selected_callback: Type[Callable], *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._config = config
         self._state_manager = state_manager
-        self._edited_msgs_map = edited_msgs_map
-        self._delete_msgs_set = delete_msgs_set
+        self._msg_state = msg_state
         self._item_selected_callback = item_selected_callback
 
         # Mapping between a message ID and the corresponding option
@@ -81,9 +85,11 @@ class ModifyMessageOptionListWidget(OptionList):
 
         # Update the display text if the message was previously edited/deleted
         for oi in option_items:
-            if (oi.msg.id in self._delete_msgs_set) or oi.msg.deleted:
+            state = self._msg_state.get(oi.msg.id)
+            action = state[0] if (state is not None) else None
+            if (action == ModifyMessageAction.DELETE) or oi.msg.deleted:
                 self.replace_option_prompt_at_index(oi.option_index, oi.generate_renderable(edited=False, deleted=True))
-            elif oi.msg.id in self._edited_msgs_map:
+            elif action == ModifyMessageAction.EDIT:
                 self.replace_option_prompt_at_index(oi.option_index, oi.generate_renderable(edited=True))
 
         msg = None
@@ -94,17 +100,22 @@ class ModifyMessageOptionListWidget(OptionList):
         self._curr_selected_msg = msg
         self._item_selected_callback(msg)
 
-    def on_message_content_changed(self, new_msg: str) -> None:
-        """ Invoked when message content is changed in the textbox """
-        msg = self._curr_selected_msg
+    def on_message_content_changed(self, new_msg: str, msg: Optional[ChatMessage] = None) -> None:
+        """ Invoked when message content is changed in the textbox (of the given message, else the selected one) """
+        if msg is None:
+            msg = self._curr_selected_msg
+        elif msg.id not in self._msg_id_option_map:
+            return  # The message belongs to an agent that is no longer listed, nothing to update on display
+
         if msg is None:
             return
 
         # Update the display text of the option item if new contents are different from original
         assert msg.id in self._msg_id_option_map, f"Message ({msg}) is not present in the mapping"
-        option_item = self._msg_id_option_map[self._curr_selected_msg.id]
+        option_item = self._msg_id_option_map[msg.id]
         edited = (new_msg != msg.msg)
-        delete = (msg.id in self._delete_msgs_set) or msg.deleted
+        state = self._msg_state.get(msg.id)
+        delete = ((state is not None) and (state[0] == ModifyMessageAction.DELETE)) or msg.deleted
         self.replace_option_prompt_at_index(option_item.option_index, option_item.generate_renderable(edited, delete))
 
     def __get_messages_by(self, agent_id: str) -> list[ChatMessage]:
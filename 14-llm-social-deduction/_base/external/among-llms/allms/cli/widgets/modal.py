@@ -8,6 +8,11 @@ from allms.config import RunTimeConfiguration, StyleConfiguration
 from allms.core.state import GameStateManager
 
 
+# CSS classes of the containers created by the modal widgets (as space-separated strings accepted by widgets)
+_BASE_CLASSES = "new-chatroom-container"
+_BORDER_CLASSES = " ".join((_BASE_CLASSES, StyleConfiguration.class_border, StyleConfiguration.class_border_highlight))
+
+
 class ModalScreenWidget(Vertical):
     """ Base class for a modal screen widget """
 
@@ -20,8 +25,7 @@ class ModalScreenWidget(Vertical):
         self.border_title = self._title
 
     def on_mount(self) -> None:
-        self.add_class(StyleConfiguration.class_border)
-        self.add_class(StyleConfiguration.class_modal_container)
+        self.add_class(StyleConfiguration.class_border, StyleConfiguration.class_modal_container)
 
     @staticmethod
     def _create_confirm_cancel_buttons(confirm_btn_id: str,
@@ -49,18 +53,10 @@ class ModalScreenWidget(Vertical):
                                cid: str = "",
                                ) -> Container:
         """ Helper method to wrap a given widget inside a container and style it """
-        if not isinstance(widgets, list):
-            widgets = [widgets]
+        widgets = widgets if type(widgets) is list else [widgets]
 
-        container = container_cls(*widgets)
+        classes = _BORDER_CLASSES if (border_title or use_border) else _BASE_CLASSES
+        container = container_cls(*widgets, id=cid or None, classes=classes)
         container.border_title = border_title
-        container.add_class("new-chatroom-container")
-
-        if cid:
-            container.id = cid
-
-        if border_title or use_border:
-            container.add_class(StyleConfiguration.class_border)
-            container.add_class(StyleConfiguration.class_border_highlight)
 
         return container
@@ -1,17 +1,18 @@
-import asyncio
+import logging
 from typing import Callable, Optional, Type
 
 from textual import on
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
-from textual.widgets import Label, TextArea, Select, Button, OptionList
+from textual.timer import Timer
+from textual.widgets import Button, Label, OptionList, Select, TextArea
 
 from allms.config import AppConfiguration, BindingConfiguration, RunTimeConfiguration
-from allms.core.agents import AgentFactory
 from allms.core.chat import ChatMessage
 from allms.core.state import GameStateManager
-from .messages import ModifyMessageOptionListWidget
+
+from .messages import ModifyMessageAction, ModifyMessageOptionListWidget
 from .modal import ModalScreenWidget
 
 
@@ -25,32 +26,34 @@ class ModifyMessageWidget(ModalScreenWidget):
                  title: str,
                  config: RunTimeConfiguration,
                  state_manager: GameStateManager,
-                 chat_msg_edit_callback: Type[Callable],
-                 chat_msg_delete_callback: Type[Callable],
+                 chat_msgs_modified_callback: Type[Callable],
                  *args, **kwargs):
         super().__init__(title, config, state_manager, *args, **kwargs)
-        self._chat_msg_edit_callback = chat_msg_edit_callback
-        self._chat_msg_delete_callback = chat_msg_delete_callback
-        self._all_agents = self._state_manager.get_all_agents()
-        self._agent_ids = sorted(list(self._all_agents.keys()), key=AgentFactory.agent_id_comparator)
+        self._chat_msgs_modified_callback = chat_msgs_modified_callback
+        self._agent_ids = self._state_manager.get_sorted_agent_ids()
 
         self._id_btn_confirm = "modify-msg-confirm-btn"
         self._id_btn_cancel = "modify-msg-cancel-btn"
 
-        self._edited_msgs_map: dict[str, str] = {}  # Mapping between msg id and new/current msg content
-        self._delete_msgs_set: set[str] = set()  # Set of msg ids to be deleted
+        # Mapping between msg id and its pending modification -- either (EDIT, new msg content) or (DELETE, None)
+        # Note: A message is either edited or deleted, never both, as marking it for deletion replaces its edit
+        self._msg_state: dict[str, tuple[str, Optional[str]]] = {}
         self._msgs_options_list = ModifyMessageOptionListWidget(self._config,
                                                                 self._state_manager,
-                                                                self._edited_msgs_map,
-                                                                self._delete_msgs_set,
+                                                                self._msg_state,
                                                                 item_selected_callback=self.__on_message_option_item_changed)
         self._msg_text_box = TextArea()
 
         self._curr_agent_id_selected: str = ""
         self._curr_msg_selected: Optional[ChatMessage] = None
 
+        # Edits made while typing are applied after a short pause, so a burst of keystrokes updates the list once
+        self._edit_debounce_delay: float = 0.075
+        self._edit_debounce_timer: Optional[Timer] = None
+        self._pending_edit: Optional[tuple[ChatMessage, str]] = None
+
     def compose(self) -> ComposeResult:
-        agent_ids = [(aid, aid) for aid in self._agent_ids]
+        agent_ids = self._state_manager.get_agent_id_options()
         default_agent_id = self._agent_ids[0]
         self._msgs_options_list.on_agent_changed(default_agent_id)
 
@@ -70,31 +73,38 @@ class ModifyMessageWidget(ModalScreenWidget):
         select_box.focus()
         self._curr_agent_id_selected = default_agent_id
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """ Event handler for button clicked event """
         btn_pressed_id = event.button.id
         if btn_pressed_id == self._id_btn_cancel:
             pass  # Nothing needs to be done -- screen will be popped on either button press
 
         elif btn_pressed_id == self._id_btn_confirm:
-            # Edit the widgets on the screen to reflect the edited messages
+            self.__commit_pending_edit()
+            # Edit the widgets on the screen to reflect the edited/deleted messages
             # Note: First need to update the messages state before invoking the callback
-            async def _modify_message(state_callback: Type[Callable], ui_callback: Type[Callable], mid: str, *args, **kwargs):
-                """ Asynchronous helper method to modify the state and UI for edit/delete messages """
-                await state_callback(mid, *args, **kwargs)
-                await ui_callback(mid)
-
-            edit_coroutines = []
-            for (msg_id, msg_contents) in self._edited_msgs_map.items():
-                assert msg_id not in self._delete_msgs_set, f"Trying to edit a message({msg_id} that has been " + \
-                    f"marked for deletion -- This should not happen."
-                edit_coroutines.append(_modify_message(self._state_manager.edit_message, self._chat_msg_edit_callback, msg_id, msg_contents, edited_by_you=True))
-
-            # Now delete the messages in the delete set
-            delete_coroutines = [_modify_message(self._state_manager.delete_message, self._chat_msg_delete_callback, mid, deleted_by_you=True)
-                                 for mid in self._delete_msgs_set]
-
-            asyncio.gather(*edit_coroutines, *delete_coroutines)
+            edited_msgs: dict[str, str] = {}
+            deleted_ids: list[str] = []
+            for msg_id, (action, msg_contents) in self._msg_state.items():
+                if action == ModifyMessageAction.DELETE:
+                    deleted_ids.append(msg_id)
+                else:
+                    edited_msgs[msg_id] = msg_contents
+
+            # Wait for the modifications to complete before the screen is popped, so none of them run against a
+            # torn-down screen and their failures are not lost
+            # Note: Edits and deletes are applied independently, a failure in one does not skip the other
+            try:
+                await self._state_manager.edit_messages(edited_msgs, edited_by_you=True)
+            except Exception as e:
+                AppConfiguration.logger.log(f"Failed to edit the messages: {e!r}", level=logging.ERROR)
+            try:
+                await self._state_manager.delete_messages(deleted_ids, deleted_by_you=True)
+            except Exception as e:
+                AppConfiguration.logger.log(f"Failed to delete the messages: {e!r}", level=logging.ERROR)
+                # Only refresh the ones deleted before the failure (re-rendering an edit that did not apply is a no-op)
+                deleted_ids = [msg_id for msg_id in deleted_ids if self._state_manager.get_message(msg_id).deleted]
+            await self._chat_msgs_modified_callback(edited_msgs.keys(), deleted_ids)
 
         else:
             # Should not arrive at this branch or else there is a bug
@@ -104,6 +114,7 @@ class ModifyMessageWidget(ModalScreenWidget):
 
     def action_mark_unmark_delete_msg(self) -> None:
         """ Invoked when key binding for marking/unmarking a message for deletion is pressed """
+        self.__commit_pending_edit()
         curr_msg = self._curr_msg_selected
         if curr_msg is None:
             return  # Ignore if no message is currently selected
@@ -112,21 +123,22 @@ class ModifyMessageWidget(ModalScreenWidget):
         if curr_msg.deleted:
             return
 
-        if curr_msg.id in self._delete_msgs_set:
-            self._delete_msgs_set.remove(curr_msg.id)
+        state = self._msg_state.get(curr_msg.id)
+        if (state is not None) and (state[0] == ModifyMessageAction.DELETE):
+            del self._msg_state[curr_msg.id]
             self._msg_text_box.read_only = False
         else:
-            self._delete_msgs_set.add(curr_msg.id)
+            self._msg_state[curr_msg.id] = (ModifyMessageAction.DELETE, None)
             self._msg_text_box.read_only = True
-            # If the message was being edited, discard the changes
-            if curr_msg.id in self._edited_msgs_map:
-                del self._edited_msgs_map[curr_msg.id]
+            # If the message was being edited, discard the changes (already replaced in the state above)
+            if state is not None:
                 self._msg_text_box.text = curr_msg.msg
 
         self._msgs_options_list.on_message_content_changed(curr_msg.msg)
 
     def __on_message_option_item_changed(self, agent_msg: ChatMessage = None) -> None:
         """ Handler invoked when a different message item is selected"""
+        self.__commit_pending_edit()
         self._curr_msg_selected = agent_msg
         text = ""
         read_only = True
@@ -136,9 +148,10 @@ class ModifyMessageWidget(ModalScreenWidget):
             text = self._curr_msg_selected.msg
             msg_id = self._curr_msg_selected.id
 
-            if msg_id not in self._delete_msgs_set:
-                if msg_id in self._edited_msgs_map:
-                    text = self._edited_msgs_map[msg_id]
+            state = self._msg_state.get(msg_id)
+            if (state is None) or (state[0] != ModifyMessageAction.DELETE):
+                if state is not None:
+                    text = state[1]
                 read_only = False
                 can_focus = True
             else:
@@ -150,9 +163,14 @@ class ModifyMessageWidget(ModalScreenWidget):
                 can_focus = False
                 text = self._curr_msg_selected.msg
 
-        self._msg_text_box.can_focus = can_focus
-        self._msg_text_box.text = text
-        self._msg_text_box.read_only = read_only
+        # Only apply what changed; re-setting the text re-parses and re-renders the whole text area
+        textbox = self._msg_text_box
+        if textbox.can_focus != can_focus:
+            textbox.can_focus = can_focus
+        if textbox.text != text:
+            textbox.text = text
+        if textbox.read_only != read_only:
+            textbox.read_only = read_only
 
     @on(Select.Changed)
     async def handler_agent_id_changed(self, event: Select.Changed) -> None:
@@ -163,15 +181,34 @@ class ModifyMessageWidget(ModalScreenWidget):
     @on(TextArea.Changed)
     async def handler_agent_message_edited(self, event: TextArea.Changed) -> None:
         """ Handler for handling events when agent's message has been edited """
-        new_msg = event.text_area.text
         if self._curr_msg_selected is None:
             return
 
-        if new_msg == self._curr_msg_selected.msg:
-            if self._curr_msg_selected.id in self._edited_msgs_map:
-                del self._edited_msgs_map[self._curr_msg_selected.id]
+        # Only the latest text of a burst of edits is applied (see __commit_pending_edit)
+        self._pending_edit = (self._curr_msg_selected, event.text_area.text)
+        if self._edit_debounce_timer is not None:
+            self._edit_debounce_timer.stop()
+        self._edit_debounce_timer = self.set_timer(self._edit_debounce_delay, self.__commit_pending_edit)
+
+    def __commit_pending_edit(self) -> None:
+        """ Helper method to apply the pending edit (if any) of the message to the edited messages """
+        if self._edit_debounce_timer is not None:
+            self._edit_debounce_timer.stop()
+            self._edit_debounce_timer = None
+
+        if self._pending_edit is None:
+            return
+
+        msg, new_msg = self._pending_edit
+        self._pending_edit = None
+        state = self._msg_state.get(msg.id)
+        if (state is not None) and (state[0] == ModifyMessageAction.DELETE):
+            pass  # The text of a message marked for deletion is only reset, never edited
+        elif new_msg == msg.msg:
+            self._msg_state.pop(msg.id, None)
         else:
-            self._edited_msgs_map[self._curr_msg_selected.id] = new_msg
+            self._msg_state[msg.id] = (ModifyMessageAction.EDIT, new_msg)
 
         # Note: Need to call the handler either ways as the display text needs to be reset
-        self._msgs_options_list.on_message_content_changed(new_msg)
+        # The message is passed explicitly as the selection may have moved on since the edit was made
+        self._msgs_options_list.on_message_content_changed(new_msg, msg)
@@ -1,9 +1,21 @@
+import asyncio
+import bisect
+from typing import Optional
+
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
 from textual.widgets import Label, LoadingIndicator
 
 from allms.config import AppConfiguration
 
+# Typing text templates indexed by the number of agents typing (up to the max. agents shown by name)
+_TYPING_FORMATS = (
+    "",
+    "{0} is typing",
+    "{0} and {1} are typing",
+    "{0}, {1} and {2} are typing",
+)
+
 
 class ChatroomIsTyping(Container):
     """ Class for displaying typing status of agents """
@@ -11,8 +23,15 @@ class ChatroomIsTyping(Container):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._are_typing = set()
+        self._are_typing_sorted: list[str] = []  # Same agents as the set, kept sorted on insert for the typing text
         self._typing_label = Label()
         self._loading_indicator = LoadingIndicator()
+        self._last_typing_str: str = ""  # Text currently shown, to skip updates that would not change anything
+
+        # Typing changes as (agent ID, is typing) -- an agent ID of None clears everyone. These are consumed by a
+        # single worker that applies bursts of them together, updating the indicator at most once per frame
+        self._events: asyncio.Queue[tuple[Optional[str], bool]] = asyncio.Queue()
+        self._frame_delay: float = 1 / 60
 
         # By default, hide them
         self._typing_label.display = False
@@ -24,28 +43,68 @@ class ChatroomIsTyping(Container):
             yield Label("  ")  # To ensure space is consumed
             yield self._loading_indicator
 
+    def on_mount(self) -> None:
+        self.run_worker(self.__consume_events(), exclusive=True)
+
     def add_typing(self, agent_id: str) -> None:
         """ Adds the given agent to the typing set """
-        self._are_typing.add(agent_id)
-        self.__update_indicator()
+        self._events.put_nowait((agent_id, True))
 
     def remove_typing(self, agent_id: str) -> None:
         """ Removes the given agent from the typing set """
-        if agent_id not in self._are_typing:
-            AppConfiguration.logger.log(f"Trying to remove {agent_id} from typing set but it doesn't exist in it: {self._are_typing}")
-            return
+        self._events.put_nowait((agent_id, False))
 
-        self._are_typing.remove(agent_id)
-        self.__update_indicator()
+    def update_typing(self, states: dict[str, bool]) -> None:
+        """ Applies the given typing states (agent ID -> is typing) """
+        for agent_id, is_typing in states.items():
+            self._events.put_nowait((agent_id, is_typing))
 
     def remove_all(self) -> None:
         """ Removes all the agents from the typing set """
-        self._are_typing.clear()
-        self.__update_indicator()
+        self._events.put_nowait((None, False))
+
+    async def __consume_events(self) -> None:
+        """ Worker that applies the queued typing changes in batches, with a single indicator update per batch """
+        events = self._events
+        while True:
+            self.__apply_event(*await events.get())
+            while not events.empty():
+                self.__apply_event(*events.get_nowait())
+
+            self.__update_indicator()
+            await asyncio.sleep(self._frame_delay)
+
+    def __apply_event(self, agent_id: Optional[str], is_typing: bool) -> None:
+        """ Helper method to apply a single typing change to the typing set """
+        if agent_id is None:
+            self._are_typing.clear()
+            self._are_typing_sorted.clear()
+        elif is_typing:
+            self.__add(agent_id)
+        elif agent_id in self._are_typing:
+            self.__discard(agent_id)
+        else:
+            AppConfiguration.logger.log(f"Trying to remove {agent_id} from typing set but it doesn't exist in it: {self._are_typing}")
+
+    def __add(self, agent_id: str) -> None:
+        """ Helper method to add the agent to the typing set, keeping the sorted list in sync """
+        if agent_id not in self._are_typing:
+            self._are_typing.add(agent_id)
+            bisect.insort(self._are_typing_sorted, agent_id)
+
+    def __discard(self, agent_id: str) -> None:
+        """ Helper method to remove the agent (if present) from the typing set, keeping the sorted list in sync """
+        if agent_id in self._are_typing:
+            self._are_typing.remove(agent_id)
+            del self._are_typing_sorted[bisect.bisect_left(self._are_typing_sorted, agent_id)]
 
     def __update_indicator(self) -> None:
         """ Helper method to update the loading indicator """
         typing_str = self.__create_is_typing_text()
+        if typing_str == self._last_typing_str:
+            return
+
+        self._last_typing_str = typing_str
         if not typing_str:
             self._typing_label.display = False
             self._loading_indicator.display = False
@@ -54,22 +113,17 @@ class ChatroomIsTyping(Container):
             self._typing_label.display = True
             self._loading_indicator.display = True
 
-    def __create_is_typing_text(self, max_agents: int = 3) -> str:
+    def __create_is_typing_text(self, max_agents: int = len(_TYPING_FORMATS) - 1) -> str:
         """ Helper method to create the text that the agents are typing """
         if not self._are_typing:
             return ""
 
-        agents = sorted(list(self._are_typing))
+        agents = self._are_typing_sorted
         n_agents_typing = len(agents)
 
-        if n_agents_typing == 1:
-            return f"{agents[0]} is typing"
-
-        elif n_agents_typing <= max_agents:
-            names_str = ", ".join(agents[:-1]) + f" and {agents[-1]}"
-            return f"{names_str} are typing"
+        if n_agents_typing <= max_agents:
+            return _TYPING_FORMATS[n_agents_typing].format(*agents)
 
         # More than max_agents are typing
-        else:
-            others_count = n_agents_typing - 1
-            return f"{agents[0]} and {others_count} others are typing"
+        others_count = n_agents_typing - 1
+        return f"{agents[0]} and {others_count} others are typing"
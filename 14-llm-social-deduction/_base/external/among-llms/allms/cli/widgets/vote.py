@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from typing import Optional
 
 from textual import on
@@ -12,12 +11,14 @@ from .modal import ModalScreenWidget
 
 
 class _RadioSetComponent(RadioSet):
-    def __init__(self, agent_ids: list[str], *args, **kwargs):
+    def __init__(self, agent_ids: tuple[str, ...], *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._agent_ids = agent_ids
-        self._radio_buttons_map: OrderedDict[str, RadioButton] = OrderedDict()
+        self._radio_buttons_map: dict[str, RadioButton] = {}
         for agent_id in self._agent_ids:
-            self._radio_buttons_map[agent_id] = RadioButton(agent_id)
+            rb = RadioButton(agent_id)
+            rb.agent_id = agent_id  # Keep the raw ID, so it need not be recovered from the label renderable
+            self._radio_buttons_map[agent_id] = rb
 
     def compose(self) -> ComposeResult:
         for rb in self._radio_buttons_map.values():
@@ -51,7 +52,7 @@ class VotingWidget(ModalScreenWidget):
     def __init__(self, title: str, config: RunTimeConfiguration, state_manager: GameStateManager, *args, **kwargs):
         super().__init__(title, config, state_manager, *args, **kwargs)
         self._your_id = state_manager.get_user_assigned_agent_id()
-        self._remaining_ids = self._state_manager.get_all_remaining_agents_ids()
+        self._remaining_ids = self._state_manager.get_sorted_remaining_agent_ids()
 
         self._voting_as = self._your_id
         self._voting_for: Optional[str] = None
@@ -65,7 +66,8 @@ class VotingWidget(ModalScreenWidget):
         # Sometimes the approaches work, sometimes they don't. Very inconsistent behavior or maybe I don't know how to
         # handle this properly. Due to this, it's just better to create a radio-set per-agent instead and swap them
         # dynamically when agent is changed
-        self._radio_widget_map: dict[str, Optional[_RadioSetComponent]] = {}
+        # Note: The radio-sets are created lazily, only for the agents that are actually selected
+        self._radio_widget_map: dict[str, _RadioSetComponent] = {}
         self._radio_widget: Optional[_RadioSetComponent] = None
         self._radio_container: Optional[Container] = None
         self._select_widget: Optional[Select] = None
@@ -73,18 +75,17 @@ class VotingWidget(ModalScreenWidget):
         self._default_info_text = "[b]Note[/]: You are allowed to vote [i]only once[/] per session"
 
     def compose(self) -> ComposeResult:
-        agent_ids = [(aid, aid) for aid in self._remaining_ids]
+        agent_ids = self._state_manager.get_remaining_agent_id_options()
         your_id = self._your_id
         can_vote, voted_for = self.__can_vote(your_id)
         info_text = self.__get_info_text(your_id)
 
         self._info_widget = Static(info_text)
-        self._radio_widget_map = {agent_id: _RadioSetComponent(agent_ids=self._remaining_ids) for agent_id in self._remaining_ids}
         self._select_widget = Select(options=agent_ids, allow_blank=False, value=your_id, compact=True)
         confirm_btn, cancel_btn = self._create_confirm_cancel_buttons(self._id_btn_confirm, self._id_btn_cancel)
 
         main_container_title = f"Who's the Human ? (Hint: {your_id})"
-        self._radio_widget = self._radio_widget_map[your_id]
+        self._radio_widget = self.__get_or_create_radio(your_id)
         self._radio_widget.update_state(agent_id=your_id, can_vote=can_vote, voted_for=voted_for)
         self._radio_container = self._wrap_inside_container(self._radio_widget, Horizontal, border_title=main_container_title, cid="voting-radio-container")
 
@@ -111,7 +112,7 @@ class VotingWidget(ModalScreenWidget):
     @on(RadioSet.Changed)
     def __update_voting_for_agent(self, event: RadioSet.Changed) -> None:
         """ Handler invoked when a different agent ID is selected """
-        self._voting_for = str(event.pressed.label)
+        self._voting_for = event.pressed.agent_id
 
     @on(Select.Changed)
     async def __update_voting_as(self, event: Select.Changed) -> None:
@@ -128,7 +129,7 @@ class VotingWidget(ModalScreenWidget):
 
         # Unmount current radio widget and swap it with the corresponding agent's widget
         await self._radio_widget.remove()
-        self._radio_widget = self._radio_widget_map[self._voting_as]
+        self._radio_widget = self.__get_or_create_radio(self._voting_as)
         self._radio_widget.update_state(agent_id=self._voting_as, can_vote=can_vote, voted_for=voted_for)
 
         await self._radio_container.mount(self._radio_widget)
@@ -138,6 +139,14 @@ class VotingWidget(ModalScreenWidget):
         self._info_widget.update(info_text)
         self._radio_widget.focus()
 
+    def __get_or_create_radio(self, agent_id: str) -> _RadioSetComponent:
+        """ Helper method to return the radio-set of the given agent, creating it on its first use """
+        radio_widget = self._radio_widget_map.get(agent_id)
+        if radio_widget is None:
+            radio_widget = _RadioSetComponent(agent_ids=self._remaining_ids)
+            self._radio_widget_map[agent_id] = radio_widget
+        return radio_widget
+
     def __vote(self) -> None:
         """ Helper method to vote for the currently selected agent ID """
         assert self._voting_for is not None, f"Trying to vote for None. This should not happen"
@@ -156,7 +165,6 @@ class VotingWidget(ModalScreenWidget):
         vote_started_yet, _ = self._state_manager.voting_has_started()
         can_vote = (not vote_started_yet) or self._state_manager.can_vote(agent_id)
         voted_for = self._state_manager.get_voted_for_who(agent_id)
-
         return can_vote, voted_for
 
     def __get_info_text(self, agent_id: str) -> str:
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Final
 
 import tzlocal
 
@@ -10,53 +11,54 @@ from .utils.logger import AppLogger
 
 class AppConfiguration:
     """ Class for any configuration required for setting up the app """
+    __slots__ = ()  # Constants only, no per-instance state
 
     # Description of the app
-    app_name: str = "Among LLMs"
-    app_tagline: list[str] = ["One human. Multiple bots.", "Do whatever it takes to not get caught!"]
-    app_version: str = version.__version__
-    app_repo: str = "https://github.com/0xd3ba/among-llms"
-    app_dev: str = "0xd3ba"
-    app_dev_email: str = "0xd3ba@gmail.com"
-    app_hackathon: str = "OpenAI Open Model Hackathon 2025"
+    app_name: Final[str] = "Among LLMs"
+    app_tagline: Final[list[str]] = ["One human. Multiple bots.", "Do whatever it takes to not get caught!"]
+    app_version: Final[str] = version.__version__
+    app_repo: Final[str] = "https://github.com/0xd3ba/among-llms"
+    app_dev: Final[str] = "0xd3ba"
+    app_dev_email: Final[str] = "0xd3ba@gmail.com"
+    app_hackathon: Final[str] = "OpenAI Open Model Hackathon 2025"
 
     # Timezone of the clock
-    timezone: str = tzlocal.get_localzone_name()
-    clock: Time = Time(timezone)
+    timezone: Final[str] = tzlocal.get_localzone_name()
+    clock: Final[Time] = Time(timezone)
 
     # List of AI models supported
-    ai_models: list[str] = [
+    ai_models: Final[list[str]] = [
         "gpt-oss:20b",
         "gpt-oss:120b",
     ]
 
-    ai_reasoning_levels: list[str] = [
+    ai_reasoning_levels: Final[list[str]] = [
         "low",
         "medium",
         "high"
     ]
 
-    default_genre: str = "sci-fi"  # The default scenario/persona genre. Must exist within scenario directory
+    default_genre: Final[str] = "sci-fi"  # The default scenario/persona genre. Must exist within scenario directory
 
     # Max. number of retries allowed by an agent for an invalid response
-    max_model_retries: int = 3
+    max_model_retries: Final[int] = 3
 
     # Minimum number of agents that should be in the game
-    min_agent_count: int = 3
+    min_agent_count: Final[int] = 3
 
     # Context size for the model -- Max. no. of messages in the chat history (public messages, DMs and notifications)
     # the model gets as context for generating a reply
     # Note(s):
     #   - Changing this to a larger value may reduce the performance as the models may take longer to produce replies
-    max_lookback_messages: int = 30
+    max_lookback_messages: Final[int] = 30
 
     # Maximum duration of an active vote (in minutes)
-    max_vote_duration_min: int = 10
+    max_vote_duration_min: Final[int] = 10
 
     # Path of the resource directories and other files
-    __parent_dir: Path = Path(__file__).parent
-    __resource_dir_root: Path = __parent_dir / "res"
-    __data_dir_root: Path = __parent_dir.parent / "data"
+    __parent_dir: Final[Path] = Path(__file__).parent
+    __resource_dir_root: Final[Path] = __parent_dir / "res"
+    __data_dir_root: Final[Path] = __parent_dir.parent / "data"
 
     # Resource configuration
     resource_scenario_dir = __resource_dir_root / "scenarios"
@@ -72,48 +74,51 @@ class AppConfiguration:
 
 class StyleConfiguration:
     """ Class holding constants for styling purposes """
-    class_border: str = "border"
-    class_border_highlight: str = "highlight-border"
-    class_modal_container: str = "modal-container"
+    __slots__ = ()  # Constants only, no per-instance state
+    class_border: Final[str] = "border"
+    class_border_highlight: Final[str] = "highlight-border"
+    class_modal_container: Final[str] = "modal-container"
 
 
 class ToastConfiguration:
     """ Class holding constants for toasts """
-    type_information: str = "information"
-    type_warning: str = "warning"
-    type_error: str = "error"
+    __slots__ = ()  # Constants only, no per-instance state
+    type_information: Final[str] = "information"
+    type_warning: Final[str] = "warning"
+    type_error: Final[str] = "error"
 
-    timeout: float = 2.0  # How long (in seconds) a toast is displayed on the screen
+    timeout: Final[float] = 2.0  # How long (in seconds) a toast is displayed on the screen
 
 
 class BindingConfiguration:
     """ Class holding the global hotkey bindings """
+    __slots__ = ()  # Constants only, no per-instance state
     # Bindings for main screen
-    main_show_about: str = "ctrl+a"
+    main_show_about: Final[str] = "ctrl+a"
 
     # Bindings for modal screens
-    modal_close_screen: str = "ctrl+w"
+    modal_close_screen: Final[str] = "ctrl+w"
 
     # Bindings for new chat creation screen
-    new_chat_randomize_scenario: str = "ctrl+r"
-    new_chat_randomize_agent_persona: str = "ctrl+r"
-    new_chat_customize_agents: str = "ctrl+s"
-    new_chat_load_from_saved: str = "ctrl+l"
+    new_chat_randomize_scenario: Final[str] = "ctrl+r"
+    new_chat_randomize_agent_persona: Final[str] = "ctrl+r"
+    new_chat_customize_agents: Final[str] = "ctrl+s"
+    new_chat_load_from_saved: Final[str] = "ctrl+l"
 
     # Bindings for chat screen
-    chatroom_show_scenario: str = "f1"
-    chatroom_show_your_persona: str = "f2"
-    chatroom_show_all_persona: str = "f3"
-    chatroom_modify_msgs: str = "f4"
-    chatroom_start_vote: str = "f5"
-    chatroom_send_message: str = "enter"
-    chatroom_quit: str = "ctrl+w"
+    chatroom_show_scenario: Final[str] = "f1"
+    chatroom_show_your_persona: Final[str] = "f2"
+    chatroom_show_all_persona: Final[str] = "f3"
+    chatroom_modify_msgs: Final[str] = "f4"
+    chatroom_start_vote: Final[str] = "f5"
+    chatroom_send_message: Final[str] = "enter"
+    chatroom_quit: Final[str] = "ctrl+w"
 
     # Bindings for modify message screen
-    modify_msgs_mark_unmark_delete: str = "ctrl+x"
+    modify_msgs_mark_unmark_delete: Final[str] = "ctrl+x"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunTimeConfiguration:
     """ Configuration class holding constants from CLI and YAML config file """
 
@@ -1,12 +1,67 @@
-from collections import deque
+import bisect
+import sys
 from dataclasses import dataclass, field
+from typing import Iterable, Iterator
 
 from allms.config import AppConfiguration
+
 from .generate import NameGenerator, PersonaGenerator
 
 
-@dataclass
-class Agent:
+class _ChatRing:
+    """
+    Fixed-size ring buffer for the chat logs of an agent (drop-in for a deque with maxlen). The roles, messages and
+    message-ID flags are kept in preallocated parallel arrays, so an append is just three index writes
+    """
+    __slots__ = ("roles", "payloads", "is_id", "head", "size")
+
+    def __init__(self, n: int, items: Iterable[tuple[str, str, bool]] = ()):
+        assert n > 0, f"Expected the size of the chat ring to be > 0 but received {n} instead"
+        self.roles: list[str | None] = [None] * n
+        self.payloads: list[str | None] = [None] * n
+        self.is_id = bytearray(n)
+        self.head = 0  # Index of the next write
+        self.size = 0
+        for (role, msg, is_message_id) in items:
+            self.append(role, msg, is_message_id)
+
+    def append(self, role: str, msg: str, is_message_id: bool) -> None:
+        """ Appends the item, overwriting the oldest one if the ring is full """
+        head, n = self.head, len(self.roles)
+        self.roles[head] = role
+        self.payloads[head] = msg
+        self.is_id[head] = is_message_id
+        self.head = (head + 1) % n
+        if self.size < n:
+            self.size += 1
+
+    def clear(self) -> None:
+        n = len(self.roles)
+        self.roles = [None] * n
+        self.payloads = [None] * n
+        self.is_id = bytearray(n)
+        self.head = self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[tuple[str, str, bool]]:
+        """ Iterates over the items from the oldest to the latest """
+        n = len(self.roles)
+        roles, payloads, is_id = self.roles, self.payloads, self.is_id
+        start = (self.head - self.size) % n
+        for i in range(start, start + self.size):
+            i %= n
+            yield roles[i], payloads[i], bool(is_id[i])
+
+
+class _AgentSlots:
+    """ Slots for the agent attributes that are not dataclass fields (and hence neither saved nor loaded) """
+    __slots__ = ("_Agent__sorted_ids",)
+
+
+@dataclass(slots=True)
+class Agent(_AgentSlots):
     """ Class for an agent """
     id: str       # The unique identifier of the agent
     persona: str  # The persona assigned to the agent
@@ -24,26 +79,42 @@ class Agent:
     # the state in each and every chat log -- a better way is to just store the message IDs of all chat messages
     # and keep the notifications etc. as normal formatted messages. On every iteration, the LLM will fetch the latest
     # contents (even if edited/deleted) instead of stale version (if stored as formatted messages instead of IDs)
-    chat_logs: deque[tuple[str, str, bool]] = field(default_factory=lambda: deque(maxlen=AppConfiguration.max_lookback_messages))
+    chat_logs: _ChatRing = field(default_factory=lambda: _ChatRing(AppConfiguration.max_lookback_messages))
     __latest_msg: str = ""  # Use as Producer/Consumer flags
 
+    def __post_init__(self):
+        # Interned as the agent ID is a key in most of the game state maps
+        self.id = sys.intern(self.id)
+
+        # Chat logs loaded from a save file are plain lists of [role, message, is_message_id]
+        if not isinstance(self.chat_logs, _ChatRing):
+            self.chat_logs = _ChatRing(AppConfiguration.max_lookback_messages, items=self.chat_logs or ())
+
+        # Sorted copies of the message ID sets, built on first use and then kept sorted on insert. Keyed by None for
+        # the messages sent by the agent, else by (agent ID, dm_received) for the DMs
+        # Note: Not a field, so it is neither saved nor loaded -- it is rebuilt from the sets when needed
+        self.__sorted_ids: dict[tuple[str, bool] | None, list[str]] = {}
+
     def add_message_id(self, msg_id: str) -> None:
         """ Adds the message ID to the list of IDs sent by the agent """
         if msg_id not in self.msg_ids:
             self.msg_ids.add(msg_id)
+            self.__insert_sorted_id(None, msg_id)
 
     def add_dm_message_id(self, msg_id: str, agent_id: str, dm_received: bool) -> None:
         """ Adds the message id received (dm_received=True) or sent (dm_received=False) to the agent ID """
         dm_map = self.dm_msg_ids_recv if dm_received else self.dm_msg_ids_sent
         if agent_id not in dm_map:
             dm_map[agent_id] = set()
-        dm_map[agent_id].add(msg_id)
+        if msg_id not in dm_map[agent_id]:
+            dm_map[agent_id].add(msg_id)
+            self.__insert_sorted_id((agent_id, dm_received), msg_id)
 
     def add_to_chat_log(self, role: str, msg: str, is_message_id: bool = False) -> None:
         """ Add the given message/message ID to the chat log """
         msg_type = "message ID" if is_message_id else "message"
         AppConfiguration.logger.log(f"Adding the following {msg_type} to chat-log for agent({self.id}): {msg}")
-        self.chat_logs.append((role, msg, is_message_id))
+        self.chat_logs.append(role, msg, is_message_id)
         self.__latest_msg = msg  # Doesn't matter if it is an ID or a raw message
 
     def can_reply(self, latest_msg_id: str | None) -> bool:
@@ -55,10 +126,8 @@ class Agent:
 
     def get_message_ids(self, latest_first: bool = True) -> list[str]:
         """ Returns a sorted list of all the message IDs of the messages sent by the agent """
-        msgs_list = sorted(list(self.msg_ids))
-        if latest_first:
-            msgs_list = msgs_list[::-1]
-        return msgs_list
+        msgs_list = self.__get_sorted_ids(None, self.msg_ids)
+        return msgs_list[::-1] if latest_first else msgs_list[:]
 
     def get_dm_message_ids(self, agent_id: str, dm_received: bool, latest_first: bool = True) -> list[str]:
         """
@@ -69,13 +138,24 @@ class Agent:
         msg_ids = []
 
         if agent_id in dm_map:
-            msg_ids = dm_map[agent_id]
-            msg_ids = sorted(list(msg_ids))
-            if latest_first:
-                msg_ids = msg_ids[::-1]
+            msg_ids = self.__get_sorted_ids((agent_id, dm_received), dm_map[agent_id])
+            msg_ids = msg_ids[::-1] if latest_first else msg_ids[:]
 
         return msg_ids
 
+    def __get_sorted_ids(self, key: tuple[str, bool] | None, msg_ids: set[str]) -> list[str]:
+        """ Helper method to return the sorted list of the given message IDs, sorting them only on first use """
+        sorted_ids = self.__sorted_ids.get(key)
+        if sorted_ids is None:
+            sorted_ids = self.__sorted_ids[key] = sorted(msg_ids)
+        return sorted_ids
+
+    def __insert_sorted_id(self, key: tuple[str, bool] | None, msg_id: str) -> None:
+        """ Helper method to insert the new message ID into its sorted list (if it has been built already) """
+        sorted_ids = self.__sorted_ids.get(key)
+        if sorted_ids is not None:
+            bisect.insort(sorted_ids, msg_id)
+
     def get_persona(self) -> str:
         """ Returns the persona of the agent """
         return self.persona
@@ -89,6 +169,7 @@ class Agent:
         self.msg_ids.clear()
         self.dm_msg_ids_recv.clear()
         self.dm_msg_ids_sent.clear()
+        self.__sorted_ids.clear()
         self.chat_logs.clear()
 
 
@@ -1,5 +1,28 @@
 from .message import ChatMessage
 
+# Templates for the exported messages, one for every combination of (has intent, has suspect)
+_EXPORT_TMPL_BASE = "[{sender}]{arrow}\n{contents}"
+_EXPORT_TMPL_INTENT = "\n({intent})"
+_EXPORT_TMPL_SUSPECT = "\nSuspect:    {suspect}\nConfidence: {confidence}\nReason:     {reason}\n"
+_EXPORT_TMPLS = {
+    (False, False): _EXPORT_TMPL_BASE,
+    (True,  False): _EXPORT_TMPL_BASE + _EXPORT_TMPL_INTENT,
+    (False, True):  _EXPORT_TMPL_BASE + _EXPORT_TMPL_SUSPECT,
+    (True,  True):  _EXPORT_TMPL_BASE + _EXPORT_TMPL_INTENT + _EXPORT_TMPL_SUSPECT,
+}
+
+_SUSPICION_TMPL = "Current suspect: {suspect}; Confidence: {confidence}; Reason: {reason}. "
+_SUSPICION_TMPLS = {
+    False: _SUSPICION_TMPL,
+    True:  _SUSPICION_TMPL + "Perhaps you should consider starting a vote",  # When the confidence is high enough
+}
+
+_HACKED_TMPL = "[IMPORTANT] The human has {modifier} your previous message -- '{prev}'"
+_HACKED_TMPLS = {
+    True:  _HACKED_TMPL.replace("{modifier}", "EDITED") + " to '{curr}'",
+    False: _HACKED_TMPL.replace("{modifier}", "DELETED"),
+}
+
 
 class ChatMessageFormatter:
     """ Class to format a given message into human-readable strings """
@@ -14,33 +37,20 @@ class ChatMessageFormatter:
         # <suspect info>
         sender = msg.sent_by.upper()
         receiver = msg.sent_to
-        contents = msg.msg.strip()
         intent = msg.thought_process
-        sent_by_you = msg.sent_by_you
         suspect_id = msg.suspect
-        suspect_confidence = msg.suspect_confidence
-        suspect_reason = msg.suspect_reason
 
         your_msg = (msg.sent_by == your_id)
-        sender_fmt = f"{sender}/hacked" if (sent_by_you and not your_msg) else sender
-        intent_fmt = f"({intent})" if intent else ""
-        suspect_fmt = "" if suspect_id is None else (
-            f"Suspect:    {suspect_id.upper()}\n"
-            f"Confidence: {suspect_confidence}\n"
-            f"Reason:     {suspect_reason}\n"
-        )
-
-        fmt_msg = [
-            f"[{sender_fmt}]" + ("" if (receiver is None) else f" -> [{receiver.upper()}]"),
-            f"{contents}",
-        ]
-
-        if intent_fmt:
-            fmt_msg.append(intent_fmt)
-        if suspect_fmt:
-            fmt_msg.append(suspect_fmt)
-
-        return "\n".join(fmt_msg)
+        tmpl = _EXPORT_TMPLS[(bool(intent), suspect_id is not None)]
+        return tmpl.format_map({
+            "sender": f"{sender}/hacked" if (msg.sent_by_you and not your_msg) else sender,
+            "arrow": "" if (receiver is None) else f" -> [{receiver.upper()}]",
+            "contents": msg.msg.strip(),
+            "intent": intent,
+            "suspect": suspect_id and suspect_id.upper(),
+            "confidence": msg.suspect_confidence,
+            "reason": msg.suspect_reason,
+        })
 
     @staticmethod
     def format_to_string(msg: ChatMessage) -> str:
@@ -70,11 +80,9 @@ class ChatMessageFormatter:
         suspect = msg.suspect
         assert suspect is not None, f"Creating a suspicion message but the suspect is None. Should not have invoked."
 
-        suspect_reason = msg.suspect_reason
         suspect_confidence = msg.suspect_confidence
-        fmt_msg = f"Current suspect: {suspect}; Confidence: {suspect_confidence}; Reason: {suspect_reason}. "
-        if suspect_confidence >= 80:
-            fmt_msg += f"Perhaps you should consider starting a vote"
+        tmpl = _SUSPICION_TMPLS[suspect_confidence >= 80]
+        fmt_msg = tmpl.format_map({"suspect": suspect, "confidence": suspect_confidence, "reason": msg.suspect_reason})
         return fmt_msg
 
     @staticmethod
@@ -97,9 +105,5 @@ class ChatMessageFormatter:
         # Format:
         # [IMPORTANT] The human has EDITED your previous message -- '<prev_message>' to '<new_message>'
         # [IMPORTANT] The human has DELETED your previous message -- '<prev_message>'
-        modifier = "EDITED" if is_edit else "DELETED"
-        fmt_msg = f"[IMPORTANT] The human has {modifier} your previous message -- '{msg_previous}'"
-        if is_edit:
-            fmt_msg += f" to '{msg_current}'"
-
+        fmt_msg = _HACKED_TMPLS[is_edit].format_map({"prev": msg_previous, "curr": msg_current})
         return fmt_msg
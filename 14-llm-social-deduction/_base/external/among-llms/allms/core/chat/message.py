@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -39,6 +40,11 @@ class ChatMessage:
     # Stores the history of the edits/delete of the message
     history_log: list[ChatMessageEditLog] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Share one copy of the IDs with the maps they are looked up in
+        self.id = sys.intern(self.id)
+        self.sent_by = sys.intern(self.sent_by)
+
     def can_edit_or_delete(self) -> bool:
         """ Returns True if allowed to edit/delete, else False """
         return not self.deleted
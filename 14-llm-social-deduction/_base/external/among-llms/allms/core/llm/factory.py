@@ -2,6 +2,9 @@ from instructor import Instructor
 
 from .client import *
 
+# Clients created so far, keyed by (model_name, is_offline) -- reused so that every new game shares the connection pool
+_clients: dict[tuple[str, bool], Instructor] = {}
+
 
 def client_factory(model: str, is_offline: bool) -> Instructor:
     """ Factory method for the client """
@@ -14,9 +17,16 @@ def client_factory(model: str, is_offline: bool) -> Instructor:
 
     # TODO: Extract the API key and pass it to create_client if the model is not offline
 
-    supported_configs = "\n".join([f"model={model}: offline={is_offline}" for (model, is_offline) in models_map.items()])
-    assert tuple([model, is_offline]) in models_map, f"Given configuration: ({model}, {is_offline}) is not supported" + \
-        f"Supported model configurations: {supported_configs}"
+    key = (model, is_offline)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    model_cls = models_map.get(key)
+    if model_cls is None:
+        supported_configs = "\n".join(f"model={m}: offline={o}" for (m, o) in models_map)
+        raise ValueError(f"Given configuration: ({model}, {is_offline}) is not supported. " +
+                         f"Supported model configurations:\n{supported_configs}")
 
-    model_cls = models_map[(model, is_offline)]
-    return model_cls.create_client()
+    client = _clients[key] = model_cls.create_client()
+    return client
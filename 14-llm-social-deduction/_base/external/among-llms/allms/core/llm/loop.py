@@ -28,11 +28,8 @@ class ChatLoop:
         self._callbacks = callbacks
 
         self._terminated_agent_ids = terminated_agent_ids
-        self._llm_agent_ids = {
-            agent_id for agent_id in self._agents.keys()
-            if (agent_id != self._your_id) and (agent_id not in self._terminated_agent_ids)
-        }  # All except you and the terminated agents
-        self._stop_loop: dict[str, bool] = {aid: False for aid in self._llm_agent_ids}
+        self._llm_agent_ids = set(self._agents) - self._terminated_agent_ids - {self._your_id}  # All except you and the terminated agents
+        self._stop_loop: dict[str, bool] = dict.fromkeys(self._llm_agent_ids, False)
         self._agent_tasks: dict[str, asyncio.Task] = {}
         self._pause_loop: bool = False
 
@@ -42,6 +39,7 @@ class ChatLoop:
         # global messages per agent
         self._llm_chat_history: dict[str, deque[str]] = {agent_id: deque() for agent_id in self._llm_agent_ids}
 
+        self._allowed_ids: Optional[frozenset[str]] = None  # Last allowed agent-IDs set in the response model
         self.__update_response_model_allowed_ids()
         self._llm_agents_mgr = LLMAgentsManager(config=config, scenario=scenario, agents=self._agents, callbacks=self._callbacks)
 
@@ -88,6 +86,7 @@ class ChatLoop:
         agent_id = agent.id
         voting_not_started_prompt = self._llm_agents_mgr.get_input_prompt(agent_id, voting_has_started=False)
         voting_started_prompt = ""
+        voting_started_prompts: dict[tuple[Optional[str], Optional[str]], str] = {}  # Keyed by (started_by, voted_for)
         voted_for: Optional[str] = None
         msg_id = None
         turns_skipped = 0
@@ -113,11 +112,15 @@ class ChatLoop:
                 turns_skipped = 0
                 vote_started, vote_started_by = await self._callbacks.invoke(StateManagerCallbackType.VOTE_HAS_STARTED)
                 if vote_started:
-                    voting_started_prompt = self._llm_agents_mgr.get_input_prompt(
-                        agent_id, voting_has_started=True,
-                        started_by=vote_started_by,
-                        voted_for=voted_for
-                    )
+                    # The prompt only changes with who started the vote and whom the agent voted for
+                    key = (vote_started_by, voted_for)
+                    voting_started_prompt = voting_started_prompts.get(key)
+                    if voting_started_prompt is None:
+                        voting_started_prompt = voting_started_prompts[key] = self._llm_agents_mgr.get_input_prompt(
+                            agent_id, voting_has_started=True,
+                            started_by=vote_started_by,
+                            voted_for=voted_for
+                        )
 
                 AppConfiguration.logger.log(f"Requesting response from agent ({agent_id}) ... ")
                 input_prompt = voting_started_prompt if vote_started else voting_not_started_prompt
@@ -143,19 +146,17 @@ class ChatLoop:
                 start_a_vote: bool = model_response.start_a_vote
                 voting_for: Optional[str] = model_response.voting_for
 
-                # 1. Send the message
-                msg_id = await self._callbacks.invoke(StateManagerCallbackType.SEND_MESSAGE, msg=msg, sent_by=agent_id, sent_by_you=False,
-                                                      sent_to=send_to, thought_process=thought_process, suspect_id=suspect,
-                                                      suspect_reason=suspect_reason, suspect_confidence=suspect_confidence)
-
-                # 2. Update the GUI
-                await self._callbacks.invoke(StateManagerCallbackType.IS_TYPING, agent_id, is_typing=False)
-                await self._callbacks.invoke(StateManagerCallbackType.UPDATE_UI_ON_NEW_MESSAGE, msg_id=msg_id)
-                await asyncio.sleep(0.1)  # Give up control for ~100ms to allow textual to render the message
-
-                # 3. Start the vote if the agent requested to start the vote
-                # Note: Vote might have started while the model was generating a response. Recheck again
-                vote_started, _ = await self._callbacks.invoke(StateManagerCallbackType.VOTE_HAS_STARTED)
+                # 1. Send the message, and update the GUI (typing status and the new message)
+                # Note: Vote might have started while the model was generating a response, the returned status is fresh
+                msg_id, vote_started, ui_attached = await self._callbacks.invoke(
+                    StateManagerCallbackType.POST_MESSAGE_COMMIT, agent_id,
+                    msg=msg, sent_to=send_to, thought_process=thought_process, suspect_id=suspect,
+                    suspect_reason=suspect_reason, suspect_confidence=suspect_confidence
+                )
+                # Give up control for ~100ms to allow textual to render the message (just yield if there is no UI)
+                await asyncio.sleep(0.1 if ui_attached else 0)
+
+                # 2. Start the vote if the agent requested to start the vote
                 if start_a_vote and (not vote_started):
                     AppConfiguration.logger.log(f"{agent_id} has requested to start a vote. Initiating the voting process ...")
                     await self._callbacks.invoke(StateManagerCallbackType.START_A_VOTE, started_by=agent_id)
@@ -169,8 +170,10 @@ class ChatLoop:
 
     def __update_response_model_allowed_ids(self) -> None:
         """ Helper method to update the allowed agent IDs in the response model """
-        allowed_ids = self._llm_agent_ids.copy()
-        allowed_ids.add(self._your_id)
+        allowed_ids = frozenset(self._llm_agent_ids | {self._your_id})
+        if allowed_ids == self._allowed_ids:
+            return  # Nothing changed since the last update
 
         # Set the class attributes of the allowed agent-IDs in the response models
+        self._allowed_ids = allowed_ids
         LLMResponseModel.set_allowed_ids(allowed_ids)
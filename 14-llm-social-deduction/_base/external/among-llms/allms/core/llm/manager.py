@@ -27,6 +27,16 @@ class LLMAgentsManager:
         self._bg_prompt = self.__get_background_prompt()
         self._op_prompt = self.__get_output_prompt()
 
+        # The instruction messages do not change during the game, so they are created once and reused every turn
+        self._human_msg = self.__create_static_message(content=self._there_is_a_human_prompt)
+        self._bg_msg = self.__create_static_message(content=self._bg_prompt)
+        self._op_msg = self.__create_static_message(content=self._op_prompt)
+        self._term_msg_cache: dict[frozenset[str], dict[str, str]] = {}  # Keyed by the terminated agents
+
+        # Formatted chat-log messages keyed by (message ID, role), along with the version of the message they were
+        # formatted at -- the length of its edit/delete history, which grows with every edit or delete
+        self._msg_cache: dict[tuple[str, str], tuple[int, dict[str, str]]] = {}
+
     async def generate_response(self, agent_id: str, input_prompt: str, terminated_agents: set[str]) -> LLMResponseModel | None:
         """ Generates a response by the LLM and returns it """
         tries = 0
@@ -34,13 +44,10 @@ class LLMAgentsManager:
         parsed_response = None
 
         # Note: Need to include the instructions in the history
-        human_prompt = await self.__create_message(content=self._there_is_a_human_prompt)
-        bg_prompt = await self.__create_message(content=self._bg_prompt)
-        op_prompt = await self.__create_message(content=self._op_prompt)
-        ip_prompt = await self.__create_message(content=input_prompt)
-        term_prompt = await self.__create_message(content=self._prompt.generate_terminated_agents_prompt(terminated_agents))
+        ip_prompt = self.__create_static_message(content=input_prompt)
+        term_prompt = self.__get_terminated_agents_message(terminated_agents)
         history = await self.__prepare_history(agent_id)
-        messages = [bg_prompt] + history + [ip_prompt, human_prompt, term_prompt, op_prompt]
+        messages = [self._bg_msg] + history + [ip_prompt, self._human_msg, term_prompt, self._op_msg]
 
         while tries < AppConfiguration.max_model_retries:
             tries += 1
@@ -65,7 +72,7 @@ class LLMAgentsManager:
                 AppConfiguration.logger.log(f"[{tries}] {agent_id} generated a malformed response: {generated_message}. " +
                                             f"Exception: {e}. ENSURE YOU ADHERE TO THE EXPECTED OUTPUT SCHEMA", level=logging.CRITICAL)
                 # Add in the exception message to the list of messages inorder for the model to generate a better response next time
-                exception_msg = await self.__create_message(content=str(e), role=LLMRoles.system)
+                exception_msg = self.__create_static_message(content=str(e), role=LLMRoles.system)
                 messages.append(exception_msg)
                 continue
 
@@ -86,6 +93,15 @@ class LLMAgentsManager:
     def __get_presence_of_human_prompt(self) -> str:
         return self._prompt.generate_presence_of_human_prompt()
 
+    def __get_terminated_agents_message(self, terminated_agents: set[str]) -> dict[str, str]:
+        """ Helper method to return the terminated agents message, creating it only when the terminated agents change """
+        key = frozenset(terminated_agents)
+        message = self._term_msg_cache.get(key)
+        if message is None:
+            content = self._prompt.generate_terminated_agents_prompt(terminated_agents)
+            message = self._term_msg_cache[key] = self.__create_static_message(content=content)
+        return message
+
     async def __prepare_history(self, agent_id: str) -> list[dict[str, str]]:
         """ Helper method to prepare the message history of the agent required for context """
         agent = self._agents[agent_id]
@@ -94,19 +110,34 @@ class LLMAgentsManager:
         # Each message must be of the following format
         # {"role": "user",      "content": <message>} for messages by other agents
         # {"role": "assistant", "content": <message>} for messages by this agent
+
+        # Fetch all the messages referenced by ID in a single callback, and only format the ones not seen before or
+        # modified since they were last formatted
+        msg_ids = [msg for (_, msg, is_id) in chat_log if is_id]
+        chat_msgs: list[ChatMessage] = []
+        if msg_ids:
+            chat_msgs = await self._callbacks.invoke(StateManagerCallbackType.GET_MESSAGES_WITH_IDS, msg_ids)
+
+        msg_cache = self._msg_cache
+        chat_msgs_iter = iter(chat_msgs)
         messages = []
         for (role, msg, is_id) in chat_log:
-            message = await self.__create_message(role=role, content=msg, is_message_id=is_id)
-            messages.append(message)
+            if not is_id:
+                messages.append(self.__create_static_message(content=msg, role=role))
+                continue
 
-        return messages
+            chat_msg = next(chat_msgs_iter)
+            key = (msg, role)
+            version = len(chat_msg.history_log)
+            cached = msg_cache.get(key)
+            if (cached is None) or (cached[0] != version):
+                content = ChatMessageFormatter.format_to_string(chat_msg)
+                cached = msg_cache[key] = (version, self.__create_static_message(content=content, role=role))
+            messages.append(cached[1])
 
-    async def __create_message(self, content: str, role: str = LLMRoles.system, is_message_id: bool = False) -> dict[str, str]:
-        """ Helper method to create the dict in the format required """
-        # If the contents is actually a message ID, need to fetch the message contents and then format it
-        if is_message_id:
-            msg: ChatMessage = await self._callbacks.invoke(StateManagerCallbackType.GET_MESSAGE_WITH_ID, content)
-            content = ChatMessageFormatter.format_to_string(msg)
+        return messages
 
-        message = dict(role=role, content=content)
-        return message
+    @staticmethod
+    def __create_static_message(content: str, role: str = LLMRoles.system) -> dict[str, str]:
+        """ Helper method to create the dict in the format required, for contents that are not message IDs """
+        return dict(role=role, content=content)
@@ -8,6 +8,7 @@ class StateManagerCallbackType(BaseCallbackType):
 
     GET_RECENT_MESSAGE_IDS: str = "get_recent_message_ids"
     GET_MESSAGE_WITH_ID: str = "get_message_with_id"
+    GET_MESSAGES_WITH_IDS: str = "get_messages_with_ids"
     IS_TYPING: str = "is_typing"
     SEND_MESSAGE: str = "send_message"
     VOTE_HAS_STARTED: str = "vote_started"
@@ -15,10 +16,13 @@ class StateManagerCallbackType(BaseCallbackType):
     VOTE_FOR: str = "vote_for"
     END_THE_VOTE: str = "end_vote"
     UPDATE_UI_ON_NEW_MESSAGE: str = "update_ui"
+    POST_MESSAGE_COMMIT: str = "post_message_commit"
 
 
 class StateManagerCallbacks(BaseCallbacks):
     """ Class containing the callbacks of the state manager required by the chat-loop class """
 
+    __slots__ = ()
+
     def __init__(self, callback_mappings: dict[StateManagerCallbackType, Callable[..., Any]] = None):
         super().__init__(callback_mappings)
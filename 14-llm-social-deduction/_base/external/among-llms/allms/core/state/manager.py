@@ -7,7 +7,7 @@ from collections import Counter
 from dataclasses import asdict
 from pathlib import Path
 from threading import Lock
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterable, Optional
 
 from allms.cli.callbacks import ChatCallbackType, ChatCallbacks
 from allms.config import AppConfiguration, RunTimeConfiguration
@@ -39,6 +39,21 @@ class GameStateManager:
         self._self_callbacks: StateManagerCallbacks = StateManagerCallbacks(self.__generate_callbacks())
         self._chat_loop: Optional[ChatLoop] = None
 
+        # Incremented whenever the set of (remaining) agents changes, so that callers can cache agent lookups
+        self._agents_revision: int = 0
+
+        # Sorted agent IDs (all, remaining) cached for the agents revision they were computed at
+        self._sorted_agent_ids_revision: int = -1
+        self._sorted_agent_ids: tuple[str, ...] = ()
+        self._sorted_remaining_ids: tuple[str, ...] = ()
+        self._agent_id_options: tuple[tuple[str, str], ...] = ()      # As (prompt, value) options for selections
+        self._remaining_id_options: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def agents_revision(self) -> int:
+        """ Returns the current revision of the agents (changes when agents are created, loaded or terminated) """
+        return self._agents_revision
+
     async def new(self) -> None:
         """ Creates a new game state """
         self._logger.log("Creating a new game state ...")
@@ -56,6 +71,7 @@ class GameStateManager:
         try:
             game_state = self.__load_and_validate_game_state(file_path, reset)
             self._game_state = game_state
+            self._agents_revision += 1
         except (json.JSONDecodeError, Exception) as err:
             raise err
 
@@ -170,6 +186,7 @@ class GameStateManager:
         self.__check_game_state_validity()
 
         self._game_state.initialize_agents(agents)
+        self._agents_revision += 1
 
     def get_agent(self, agent_id: str) -> Agent:
         """ Returns the agent with the specified agent ID """
@@ -186,11 +203,49 @@ class GameStateManager:
         self.__check_game_state_validity()
         return self._game_state.get_terminated_agent_ids()
 
+    def get_terminated_count(self) -> int:
+        """ Returns the number of agents that have been terminated """
+        self.__check_game_state_validity()
+        return self._game_state.get_number_of_terminated_agents()
+
     def get_all_remaining_agents_ids(self) -> list[str]:
         """ Returns all the IDs of the agents that are remaining """
         self.__check_game_state_validity()
         return self._game_state.get_all_remaining_agents_ids()
 
+    def get_sorted_agent_ids(self) -> tuple[str, ...]:
+        """ Returns the IDs of all the agents (including the terminated ones) in sorted order """
+        self.__refresh_sorted_agent_ids()
+        return self._sorted_agent_ids
+
+    def get_sorted_remaining_agent_ids(self) -> tuple[str, ...]:
+        """ Returns the IDs of the remaining agents in sorted order """
+        self.__refresh_sorted_agent_ids()
+        return self._sorted_remaining_ids
+
+    def get_agent_id_options(self) -> tuple[tuple[str, str], ...]:
+        """ Returns the sorted IDs of all the agents as (prompt, value) pairs for selection widgets """
+        self.__refresh_sorted_agent_ids()
+        return self._agent_id_options
+
+    def get_remaining_agent_id_options(self) -> tuple[tuple[str, str], ...]:
+        """ Returns the sorted IDs of the remaining agents as (prompt, value) pairs for selection widgets """
+        self.__refresh_sorted_agent_ids()
+        return self._remaining_id_options
+
+    def __refresh_sorted_agent_ids(self) -> None:
+        """ Helper method to re-sort the agent IDs only when the agents have changed since they were last sorted """
+        if self._sorted_agent_ids_revision == self._agents_revision:
+            return
+
+        self.__check_game_state_validity()
+        self._sorted_agent_ids = tuple(sorted(self._game_state.get_all_agents(), key=AgentFactory.agent_id_comparator))
+        terminated_ids = self._game_state.get_terminated_agent_ids()
+        self._sorted_remaining_ids = tuple(aid for aid in self._sorted_agent_ids if aid not in terminated_ids)
+        self._agent_id_options = tuple((aid, aid) for aid in self._sorted_agent_ids)
+        self._remaining_id_options = tuple((aid, aid) for aid in self._sorted_remaining_ids)
+        self._sorted_agent_ids_revision = self._agents_revision
+
     def pick_random_agent_id(self) -> str:
         """ Picks an agent at random and returns its ID """
         self.__check_game_state_validity()
@@ -268,11 +323,31 @@ class GameStateManager:
         await self._game_state.add_message(msg)
         return msg.id
 
+    async def commit_agent_message(self, agent_id: str, **msg_kwargs) -> tuple[str, bool, bool]:
+        """
+        Sends the message by the given (LLM) agent, clears its typing status and updates the UI in one go.
+        Returns (message ID, whether the vote has started, whether a chat UI is attached)
+        """
+        msg_id = await self.send_message(sent_by=agent_id, sent_by_you=False, **msg_kwargs)
+        ui_attached = self._chat_callbacks is not None
+        if ui_attached:
+            self.__agent_is_typing(agent_id, is_typing=False)
+            await self.on_new_message_received(msg_id)
+
+        vote_started, _ = self.voting_has_started()
+        return msg_id, vote_started, ui_attached
+
     def get_message(self, msg_id: str) -> ChatMessage:
         """ Returns the message associated with the given message ID """
         self.__check_game_state_validity()
         return self._game_state.get_message(msg_id)
 
+    def get_messages(self, msg_ids: list[str]) -> list[ChatMessage]:
+        """ Returns the messages associated with the given message IDs (in the same order) """
+        self.__check_game_state_validity()
+        get_message = self._game_state.get_message
+        return [get_message(msg_id) for msg_id in msg_ids]
+
     def get_all_messages(self, ids_only: bool = False) -> list[ChatMessage] | list[str]:
         """ Returns a list of chat messages or list of chat message IDs """
         return self._game_state.get_all_messages(ids_only=ids_only)
@@ -290,6 +365,18 @@ class GameStateManager:
         """ Deletes the message with the given message ID """
         await self._game_state.delete_message(msg_id, deleted_by_you)
 
+    async def edit_messages(self, edits: dict[str, str], edited_by_you: bool) -> None:
+        """ Edits the messages in the given mapping of message ID to new contents, in a single pass """
+        game_state = self._game_state
+        for msg_id, msg_contents in edits.items():
+            await game_state.edit_message(msg_id, msg_contents, edited_by_you)
+
+    async def delete_messages(self, msg_ids: Iterable[str], deleted_by_you: bool) -> None:
+        """ Deletes the messages with the given message IDs, in a single pass """
+        game_state = self._game_state
+        for msg_id in msg_ids:
+            await game_state.delete_message(msg_id, deleted_by_you)
+
     def announce_to_agents(self, inform_msg: str, announce_to: str = None) -> None:
         """ Announces the given message to the specified agent or all the agents (announce_to=None) """
         msg = self.__create_new_message(msg=inform_msg, sent_to=announce_to, is_announcement=True)
@@ -396,6 +483,7 @@ class GameStateManager:
         won = (n_remaining == 3) and (agent_id != your_id)  # n == 3 because we have not removed the agent yet
 
         self._game_state.remove_agent(agent_id)
+        self._agents_revision += 1
         self._logger.log(f"{agent_id} terminated", level=logging.CRITICAL)
 
         fmt_agent_id = self.__preprocess_agent_id(agent_id)
@@ -602,7 +690,9 @@ class GameStateManager:
         self_callbacks = {
             StateManagerCallbackType.SEND_MESSAGE: self.send_message,
             StateManagerCallbackType.UPDATE_UI_ON_NEW_MESSAGE: self.on_new_message_received,
+            StateManagerCallbackType.POST_MESSAGE_COMMIT: self.commit_agent_message,
             StateManagerCallbackType.GET_MESSAGE_WITH_ID: self.get_message,
+            StateManagerCallbackType.GET_MESSAGES_WITH_IDS: self.get_messages,
             StateManagerCallbackType.IS_TYPING: self.__agent_is_typing,
             StateManagerCallbackType.VOTE_HAS_STARTED: self.voting_has_started,
             StateManagerCallbackType.START_A_VOTE: self.start_vote,
@@ -134,6 +134,10 @@ class GameState:
         """ Returns the count of the remaining agents """
         return len(self._remaining_agent_ids)
 
+    def get_number_of_terminated_agents(self) -> int:
+        """ Returns the count of the terminated agents """
+        return len(self._all_agents) - len(self._remaining_agent_ids)
+
     def remove_agent(self, agent_id: str) -> None:
         """ Removes the agent from the tracked agents """
         assert agent_id in self._remaining_agent_ids, f"Trying to remove agent ID({agent_id}) which is not present"
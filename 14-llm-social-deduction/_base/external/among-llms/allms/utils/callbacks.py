@@ -14,6 +14,8 @@ class BaseCallbackType(str, Enum):
 class BaseCallbacks:
     """ Base class containing the callbacks  """
 
+    __slots__ = ("_callback_mappings",)
+
     def __init__(self, callback_mappings: dict[BaseCallbackType, Callable[..., Any]] = None):
         if callback_mappings is None:
             callback_mappings = {}
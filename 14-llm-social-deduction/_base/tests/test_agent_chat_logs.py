@@ -0,0 +1,45 @@
+"""Tests for the chat logs kept per agent."""
+
+import json
+from dataclasses import asdict
+
+from allms.config import AppConfiguration
+from allms.core.agents import Agent, _ChatRing
+from allms.utils.save import SavingUtils
+
+
+def test_ring_keeps_latest_entries_in_order():
+    ring = _ChatRing(3)
+    for i in range(5):
+        ring.append("user", f"msg-{i}", i % 2 == 0)
+    assert len(ring) == 3
+    assert list(ring) == [("user", "msg-2", True), ("user", "msg-3", False), ("user", "msg-4", True)]
+
+
+def test_cleared_ring_matches_a_new_one():
+    ring = _ChatRing(3)
+    ring.append("user", "msg", True)
+    ring.clear()
+    new_ring = _ChatRing(3)
+    assert list(ring) == []
+    assert (ring.roles, ring.payloads, ring.is_id, ring.head, ring.size) == \
+           (new_ring.roles, new_ring.payloads, new_ring.is_id, new_ring.head, new_ring.size)
+
+
+def test_chat_logs_survive_save_and_load():
+    agent = Agent(id="alice", persona="a persona")
+    n_logs = AppConfiguration.max_lookback_messages + 5
+    for i in range(n_logs):
+        agent.add_to_chat_log("user", f"msg-{i}", is_message_id=(i % 3 == 0))
+
+    data = json.loads(json.dumps(SavingUtils.properly_serialize_json(asdict(agent))))
+    loaded = SavingUtils.properly_deserialize_json(Agent, data)
+
+    assert isinstance(loaded.chat_logs, _ChatRing)
+    assert loaded.get_chat_logs() == agent.get_chat_logs()
+    assert len(loaded.get_chat_logs()) == AppConfiguration.max_lookback_messages
+
+    # The loaded ring still drops the oldest entry once full
+    loaded.add_to_chat_log("user", "latest")
+    assert loaded.get_chat_logs()[-1] == ("user", "latest", False)
+    assert loaded.get_chat_logs()[0] == agent.get_chat_logs()[1]
@@ -0,0 +1,55 @@
+"""Tests for parsing the text responses of the LLM agents."""
+
+import pytest
+
+from allms.core.llm.parser import LLMResponseParser
+from allms.core.llm.response import LLMResponseModel
+
+
+@pytest.fixture(autouse=True)
+def allowed_ids():
+    LLMResponseModel.set_allowed_ids(["alice", "bob"])
+    yield
+    LLMResponseModel.set_allowed_ids([])
+
+
+def _response(**overrides: str) -> str:
+    lines = {
+        "MESSAGE": "hello everyone",
+        "INTENT": "blend in",
+        "SEND_TO": "none",
+        "SUSPECT_ID": "none",
+        "SUSPECT_CONFIDENCE": "none",
+        "REASON_FOR_SUSPECT": "none",
+        "START_A_VOTE": "false",
+        "VOTING_FOR": "none",
+    }
+    lines.update(overrides)
+    return "\n".join(f"{key}: {value}" for key, value in lines.items())
+
+
+def test_parses_literals_and_integers():
+    response = LLMResponseParser.parse(_response(SUSPECT_ID="bob", SUSPECT_CONFIDENCE="80", START_A_VOTE="True",
+                                                 VOTING_FOR="bob"))
+    assert response.message == "hello everyone"
+    assert response.send_to is None
+    assert response.suspect == "bob"
+    assert response.suspect_confidence == 80
+    assert response.start_a_vote is True
+    assert response.voting_for == "bob"
+
+
+def test_none_message_is_rejected():
+    # "none" must not be posted as the literal text, the model has to retry instead
+    with pytest.raises(ValueError):
+        LLMResponseParser.parse(_response(MESSAGE="none"))
+
+
+def test_literal_intent_is_rejected():
+    with pytest.raises(ValueError):
+        LLMResponseParser.parse(_response(INTENT="true"))
+
+
+def test_first_occurrence_wins_and_quotes_are_stripped():
+    response = LLMResponseParser.parse('Some preamble\n  MESSAGE : "first: message"\n' + _response(MESSAGE="second"))
+    assert response.message == "first: message"